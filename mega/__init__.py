@@ -1,6 +1,35 @@
-from .op.function import Gamma, Haversine, JordanTotient, mobius, Quartic
-from .op.arithmethic import SigmaZ, EulerPhi, Chebyshev
-from .op.tensor import Tensor
+import importlib
 
-# utils folders
-from .utils.constant import lucas_number, catalan_number, golden_ratio
+# public name -> module that define it, extension module only loaded
+# on first attribute access (PEP 562)
+_LAZY: dict[str, str] = {
+    "Gamma": "mega.op.function",
+    "Haversine": "mega.op.function",
+    "JordanTotient": "mega.op.function",
+    "mobius": "mega.op.function",
+    "mobius_range": "mega.op.function",
+    "Quartic": "mega.op.function",
+    "SigmaZ": "mega.op.arithmethic",
+    "EulerPhi": "mega.op.arithmethic",
+    "Chebyshev": "mega.op.arithmethic",
+    "Tensor": "mega.op.tensor",
+    # utils folders
+    "lucas_number": "mega.utils.constant",
+    "catalan_number": "mega.utils.constant",
+    "golden_ratio": "mega.utils.constant",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        # cache in module namespace, next access skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,110 @@
+# MIT License
+
+# Copyright (c) 2025 WargaSlowy
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# mega/op/_jordan_numba.py
+#
+# optional numba kernel for batch jordan totient, importing this module
+# raise ImportError when numba not installed
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def _spf_sieve(N):
+    """
+    smallest prime factor sieve, spf[n] = smallest prime dividing n
+
+    Parameter:
+        N (int): upper bound of table
+
+    Return:
+        (ndarray): int64 array with length N + 1
+    """
+    spf = np.zeros(N + 1, np.int64)
+    for i in range(2, N + 1):
+        if spf[i] == 0:
+            for j in range(i, N + 1, i):
+                if spf[j] == 0:
+                    spf[j] = i
+    return spf
+
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+@njit(cache=True)
+def _checked_mul(a, b):
+    """
+    multiply two non-negative int64, -1 mark overflow and propagate
+    through next call so caller check only once at end
+
+    Parameter:
+        a (int): first factor, -1 when already overflowed
+        b (int): second factor, -1 when already overflowed
+
+    Return:
+        (int): a * b, or -1 when result exceed int64
+    """
+    if a < 0 or b < 0:
+        return -1
+    if a != 0 and b > _INT64_MAX // a:
+        return -1
+    return a * b
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def jordan_range(N, k):
+    """
+    compute jordan totient Jₖ(n) for every n in 0..N
+
+    using multiplicative property:
+        Jₖ(pᵃ) = p^((a-1)k) × (pᵏ - 1)
+
+    Parameter:
+        N (int): upper bound, inclusive
+        k (int): exponent, must be >= 1
+
+    Return:
+        (ndarray): int64 array with length N + 1, index 0 set to 0,
+                   entry set to -1 when Jₖ(n) exceed int64
+    """
+    spf = _spf_sieve(N)
+    out = np.zeros(N + 1, np.int64)
+    for n in prange(1, N + 1):
+        m = n
+        res = 1
+        while m > 1:
+            p = spf[m]
+            a = 0
+            while m % p == 0:
+                m //= p
+                a += 1
+            pk = 1
+            for _ in range(k):
+                pk = _checked_mul(pk, p)
+            term = pk - 1 if pk > 0 else -1
+            for _ in range(a - 1):
+                term = _checked_mul(term, pk)
+            res = _checked_mul(res, term)
+        out[n] = res
+    return out
@@ -23,8 +23,586 @@
 # cython: language_level=3
 # mega/op/arithmetic.pyx
 
-from libc.math cimport pow, sqrt, log
-from libc.complex cimport pow as cpow
+from libc.math cimport pow, sqrt, log, isfinite
+from libc.complex cimport cpow
+from libc.stdlib cimport malloc, free
+from libc.string cimport memset
+
+# bound of memoized compute result per function, cache cleared when full
+cdef Py_ssize_t _CACHE_MAXSIZE = 100_000
+
+# memoized result of pure compute path, keyed by input argument
+cdef dict _sigma_cache = {}
+cdef dict _phi_cache = {}
+cdef dict _theta_cache = {}
+
+
+cdef inline object _cache_store(dict cache, object key, object value):
+    """
+    store value into bounded memo cache then return it
+    """
+    if len(cache) >= _CACHE_MAXSIZE:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
+# upper bound of totient sieve table, larger n fallback into trial division
+# so single huge input not allocated hundreds of MB
+cdef Py_ssize_t _PHI_SIEVE_LIMIT = 1 << 23
+
+# module level totient table, shared by every EulerPhi instance
+cdef int *_phi_table = NULL
+cdef Py_ssize_t _phi_size = 0
+
+
+cdef int _ensure_phi(Py_ssize_t n) except -1:
+    """
+    make sure totient table covering index n, grow table geometric
+    (doubling) so repeated call with larger n amortized
+
+    sieve formula:
+        phi[i] = i, then for every prime p, phi[j] -= phi[j] / p for p | j
+
+    Parameter:
+        n (Py_ssize_t): index that must be available in table
+    """
+    global _phi_table, _phi_size
+
+    if n < _phi_size:
+        return 0
+
+    cdef Py_ssize_t size = max(n + 1, 2 * _phi_size)
+    if size > _PHI_SIEVE_LIMIT + 1:
+        size = _PHI_SIEVE_LIMIT + 1
+
+    cdef int *table = <int*>malloc(size * sizeof(int))
+    if not table:
+        raise MemoryError("failed to allocate totient table")
+
+    cdef Py_ssize_t i, j
+    for i in range(size):
+        table[i] = <int>i
+
+    for i in range(2, size):
+        # phi[i] still i mean no smaller prime touching it, so i is prime
+        if table[i] == i:
+            for j in range(i, size, i):
+                table[j] -= table[j] // i
+
+    free(_phi_table)
+    _phi_table = table
+    _phi_size = size
+    return 0
+
+
+cdef int _phi_trial_division(int n):
+    """
+    compute euler phi using integer arithmetic trial division,
+    used for input bigger than sieve table limit
+
+    Parameter:
+        n (int): positive integer
+
+    Return:
+        (int): value of phi(n)
+    """
+    cdef int result = n
+    cdef int i = 2
+
+    # handle factor 2 separately
+    if n % i == 0:
+        result -= result // i
+        while n % i == 0:
+            n //= i
+
+    i += 1
+
+    # check odd factors up to sqrt(n)
+    while i <= n // i:
+        if n % i == 0:
+            result -= result // i
+            while n % i == 0:
+                n //= i
+        i += 2
+
+    # if remaining n is a prime > 2, apply one final adjustment
+    if n > 1:
+        result -= result // n
+    return result
+
+
+# upper bound of chebyshev prefix table, larger x fallback into segmented sieve
+cdef Py_ssize_t _THETA_SIEVE_LIMIT = 1 << 23
+
+# module level prefix sum, _theta_prefix[k] = ϑ(k)
+cdef double *_theta_prefix = NULL
+cdef Py_ssize_t _theta_size = 0
+
+
+cdef int _ensure_theta(Py_ssize_t n) except -1:
+    """
+    make sure chebyshev prefix table covering index n, using bit packed
+    sieve of eratosthenes then one pass walk for accumulate log(p)
+
+    table grow geometric (doubling) so repeated call with larger x amortized
+
+    Parameter:
+        n (Py_ssize_t): index that must be available in table
+    """
+    global _theta_prefix, _theta_size
+
+    if n < _theta_size:
+        return 0
+
+    cdef Py_ssize_t size = max(n + 1, 2 * _theta_size)
+    if size > _THETA_SIEVE_LIMIT + 1:
+        size = _THETA_SIEVE_LIMIT + 1
+
+    # one bit per number, bit set mean number still prime candidate
+    cdef unsigned char *sieve = <unsigned char*>malloc((size >> 3) + 1)
+    cdef double *prefix = <double*>malloc(size * sizeof(double))
+    if not sieve or not prefix:
+        free(sieve)
+        free(prefix)
+        raise MemoryError("failed to allocate chebyshev table")
+
+    cdef Py_ssize_t i, j
+    for i in range((size >> 3) + 1):
+        sieve[i] = 0xFF
+
+    # crossing start from i * i, smaller multiple already cleared
+    i = 2
+    while i * i < size:
+        if sieve[i >> 3] & (1 << (i & 7)):
+            for j in range(i * i, size, i):
+                sieve[j >> 3] &= ~(1 << (j & 7))
+        i += 1
+
+    # kahan compensated running sum, error stay O(ε) instead of O(N·ε)
+    # `c` carry low order bit lost from previous add
+    cdef double total = 0.0
+    cdef double c = 0.0
+    cdef double y, t
+
+    prefix[0] = 0.0
+    if size > 1:
+        prefix[1] = 0.0
+    for i in range(2, size):
+        if sieve[i >> 3] & (1 << (i & 7)):
+            y = log(<double>i) - c
+            t = total + y
+            c = (t - total) - y
+            total = t
+        prefix[i] = total
+
+    free(sieve)
+    free(_theta_prefix)
+    _theta_prefix = prefix
+    _theta_size = size
+    return 0
+
+
+cdef double _theta_segmented(Py_ssize_t limit) except? -1.0:
+    """
+    compute ϑ(limit) using segmented sieve of eratosthenes, used for input
+    bigger than prefix table limit
+
+    step:
+        - sieve base prime up to √limit
+        - cross out multiple of base prime in window of √limit number
+        - accumulate log(p) of survivor with kahan compensated summation
+
+    memory stay O(√limit) instead of O(limit)
+
+    Parameter:
+        limit (Py_ssize_t): upper bound, must be >= 2
+
+    Return:
+        (double): value of ϑ(limit)
+    """
+    cdef Py_ssize_t root = <Py_ssize_t>sqrt(<double>limit)
+    while root * root > limit:
+        root -= 1
+    while (root + 1) * (root + 1) <= limit:
+        root += 1
+
+    # window at least 32 KiB so small root not spend time on loop overhead
+    cdef Py_ssize_t seg = max(root + 1, 1 << 15)
+    cdef unsigned char *base = <unsigned char*>malloc(root + 1)
+    cdef unsigned char *mark = <unsigned char*>malloc(seg)
+    cdef Py_ssize_t *primes = <Py_ssize_t*>malloc((root + 1) * sizeof(Py_ssize_t))
+    if not base or not mark or not primes:
+        free(base)
+        free(mark)
+        free(primes)
+        raise MemoryError("failed to allocate chebyshev segment")
+
+    cdef Py_ssize_t i, j, p, k, count = 0
+    cdef Py_ssize_t low, high
+    cdef double total = 0.0
+    cdef double c = 0.0
+    cdef double y, t
+
+    with nogil:
+        memset(base, 1, root + 1)
+        i = 2
+        while i * i <= root:
+            if base[i]:
+                j = i * i
+                while j <= root:
+                    base[j] = 0
+                    j += i
+            i += 1
+        for i in range(2, root + 1):
+            if base[i]:
+                primes[count] = i
+                count += 1
+
+        low = 2
+        while low <= limit:
+            high = min(low + seg - 1, limit)
+            memset(mark, 1, high - low + 1)
+            for k in range(count):
+                p = primes[k]
+                if p * p > high:
+                    break
+                # first multiple inside window, smaller multiple already cleared
+                j = max(p * p, (low + p - 1) // p * p)
+                while j <= high:
+                    mark[j - low] = 0
+                    j += p
+            for i in range(low, high + 1):
+                if mark[i - low]:
+                    y = log(<double>i) - c
+                    t = total + y
+                    c = (t - total) - y
+                    total = t
+            low = high + 1
+
+    free(base)
+    free(mark)
+    free(primes)
+    return total
+
+
+cdef extern from *:
+    # gcc/clang 128 bit integer, used for overflow free 64 bit mulmod
+    ctypedef unsigned long long uint128_t "unsigned __int128"
+
+# trial division bound before switching into pollard-rho
+cdef unsigned long long _TRIAL_LIMIT = 1 << 16
+
+# gap between candidate of 2, 3, 5 wheel starting from 7
+# 7, 11, 13, 17, 19, 23, 29, 31, 37, ...
+cdef unsigned int _WHEEL_GAPS[8]
+_WHEEL_GAPS[:] = [4, 2, 4, 2, 4, 6, 2, 6]
+
+# miller-rabin base that deterministic for every 64 bit integer
+cdef unsigned long long _MR_BASES[12]
+_MR_BASES[:] = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37]
+
+
+cdef inline unsigned long long _mulmod(
+    unsigned long long a, unsigned long long b, unsigned long long m
+) noexcept nogil:
+    return <unsigned long long>((<uint128_t>a * b) % m)
+
+
+cdef unsigned long long _powmod(
+    unsigned long long b, unsigned long long e, unsigned long long m
+) noexcept nogil:
+    cdef unsigned long long result = 1
+    b %= m
+    while e:
+        if e & 1:
+            result = _mulmod(result, b, m)
+        b = _mulmod(b, b, m)
+        e >>= 1
+    return result
+
+
+cdef unsigned long long _gcd(
+    unsigned long long a, unsigned long long b
+) noexcept nogil:
+    cdef unsigned long long t
+    while b:
+        t = a % b
+        a = b
+        b = t
+    return a
+
+
+cdef bint _is_prime(unsigned long long n) noexcept nogil:
+    """
+    deterministic miller-rabin primality test for 64 bit integer
+
+    Parameter:
+        n (unsigned long long): number to check
+
+    Return:
+        (bint): True if n is prime
+    """
+    if n < 2:
+        return False
+
+    cdef int i, _, s = 0
+    cdef unsigned long long a, x
+    cdef unsigned long long d = n - 1
+
+    for i in range(12):
+        if n % _MR_BASES[i] == 0:
+            return n == _MR_BASES[i]
+
+    while d % 2 == 0:
+        d >>= 1
+        s += 1
+
+    for i in range(12):
+        a = _MR_BASES[i]
+        x = _powmod(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(1, s):
+            x = _mulmod(x, x, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+cdef inline unsigned long long _rho_step(
+    unsigned long long y, unsigned long long c, unsigned long long n
+) noexcept nogil:
+    # f(y) = (y * y + c) mod n without overflow on the add
+    y = _mulmod(y, y, n)
+    if y >= n - c:
+        return y - (n - c)
+    return y + c
+
+
+cdef unsigned long long _brent(unsigned long long n) noexcept nogil:
+    """
+    find non-trivial factor of odd composite n using brent variant
+    of pollard-rho, product of differences batched before gcd
+
+    Parameter:
+        n (unsigned long long): odd composite number
+
+    Return:
+        (unsigned long long): factor d with 1 < d < n
+    """
+    cdef unsigned long long c = 1
+    cdef unsigned long long x, y, ys, q, g, r, k, _, lim
+    cdef unsigned long long m = 128
+
+    while True:
+        y = 2
+        r = 1
+        q = 1
+        g = 1
+        x = y
+        ys = y
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = _rho_step(y, c, n)
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                lim = m if m < r - k else r - k
+                for _ in range(lim):
+                    y = _rho_step(y, c, n)
+                    q = _mulmod(q, x - y if x > y else y - x, n)
+                g = _gcd(q, n)
+                k += m
+            r <<= 1
+
+        # batched product overshoot, walk back one step at time
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = _rho_step(ys, c, n)
+                g = _gcd(x - ys if x > ys else ys - x, n)
+
+        if g != n:
+            return g
+        # unlucky polynomial, retry with another constant
+        c += 1
+
+
+cdef int _split(unsigned long long n, dict counts) except -1:
+    """
+    recursively split cofactor n into prime and count it
+    """
+    if n == 1:
+        return 0
+    if _is_prime(n):
+        counts[n] = counts.get(n, 0) + 1
+        return 0
+    cdef unsigned long long d = _brent(n)
+    _split(d, counts)
+    _split(n // d, counts)
+    return 0
+
+
+cdef list _factor(unsigned long long n):
+    """
+    factorize n using 2, 3, 5 wheel trial division for small prime
+    then pollard-rho (brent variant) for remaining large cofactor
+
+    Parameter:
+        n (unsigned long long): positive integer
+
+    Return:
+        (list[tuple[int, int]]): pair (p, a) sorted by prime p,
+                                 where n = ∏ p^a
+    """
+    cdef dict counts = {}
+    cdef unsigned long long p
+    cdef unsigned int a, w = 0
+
+    for p in (2, 3, 5):
+        a = 0
+        while n % p == 0:
+            n //= p
+            a += 1
+        if a:
+            counts[p] = a
+
+    p = 7
+    while p <= _TRIAL_LIMIT and p * p <= n:
+        if n % p == 0:
+            a = 0
+            while n % p == 0:
+                n //= p
+                a += 1
+            counts[p] = a
+        p += _WHEEL_GAPS[w]
+        w = (w + 1) & 7
+
+    if n > 1:
+        if p * p > n:
+            # no factor below sqrt(n), so remaining n is prime
+            counts[n] = counts.get(n, 0) + 1
+        else:
+            _split(n, counts)
+
+    return sorted(counts.items())
+
+
+cdef extern from *:
+    # gcc/clang checked arithmetic, return True when result overflow
+    bint _mul_overflow "__builtin_mul_overflow"(
+        unsigned long long a, unsigned long long b, unsigned long long *res
+    ) nogil
+    bint _add_overflow "__builtin_add_overflow"(
+        unsigned long long a, unsigned long long b, unsigned long long *res
+    ) nogil
+
+# p^z table per exponent z, reused across every n with same z
+# integer z stored as python int, other z stored as complex from cpow
+cdef dict _pz_int_cache = {}
+cdef dict _pz_complex_cache = {}
+
+
+cdef bint _ipow(
+    unsigned long long b, unsigned long long e, unsigned long long *res
+) noexcept nogil:
+    """
+    compute b^e using binary exponent in 64 bit unsigned
+
+    Return:
+        (bint): True when result overflow 64 bit
+    """
+    cdef unsigned long long result = 1
+    while e:
+        if e & 1:
+            if _mul_overflow(result, b, &result):
+                return True
+        e >>= 1
+        if e and _mul_overflow(b, b, &b):
+            return True
+    res[0] = result
+    return False
+
+
+cdef bint _sigma_int_c(
+    list factors, unsigned long long z, unsigned long long *res
+) except? True:
+    """
+    compute σ_z(n) for integer z > 0 entirely in 64 bit unsigned,
+    each prime power contribute 1 + p^z + p^2z + ... + p^az (horner)
+
+    Return:
+        (bint): True when any step overflow, caller fallback to python int
+    """
+    cdef unsigned long long total = 1
+    cdef unsigned long long pz, term
+    cdef unsigned int a, _
+
+    for p_obj, a_obj in factors:
+        a = a_obj
+        if _ipow(<unsigned long long>p_obj, z, &pz):
+            return True
+        term = 1
+        for _ in range(a):
+            if _mul_overflow(term, pz, &term) or _add_overflow(term, 1, &term):
+                return True
+        if _mul_overflow(total, term, &total):
+            return True
+    res[0] = total
+    return False
+
+
+cdef object _cached_pz_int(object p, object z):
+    """
+    p ** z for integer z read from per exponent table
+    """
+    table = _pz_int_cache.get(z)
+    if table is None:
+        table = _cache_store(_pz_int_cache, z, {})
+    pz = table.get(p)
+    if pz is None:
+        pz = _cache_store(table, p, p ** z)
+    return pz
+
+
+cdef double complex _cached_pz_complex(object p, object z, double complex c_z):
+    """
+    p^z for complex (or negative real) z read from per exponent table
+    """
+    table = _pz_complex_cache.get(z)
+    if table is None:
+        table = _cache_store(_pz_complex_cache, z, {})
+    pz = table.get(p)
+    if pz is None:
+        pz = _cache_store(table, p, cpow(<double complex><double>p, c_z))
+    return pz
+
+
+cdef list _divisors(list factors):
+    """
+    generate every positive divisor from prime power factorization
+
+    Parameter:
+        factors (list[tuple[int, int]]): output of _factor
+
+    Return:
+        (list[int]): all divisor, unordered
+    """
+    cdef list divs = [1]
+    cdef list nxt
+    for p, a in factors:
+        nxt = []
+        for d in divs:
+            pk = d
+            for _ in range(a + 1):
+                nxt.append(pk)
+                pk *= p
+        divs = nxt
+    return divs
 
 
 cdef class SigmaZ:
@@ -39,7 +617,7 @@ cdef class SigmaZ:
         - when z == 1 -> sigma_z(n) = summary all divisor d of n sums d^z
 
     Attribute:
-        n (int): input number
+        n (int): input number, up to 64 bit unsigned
         z (int): exponent used in computation
 
     Example:
@@ -47,10 +625,10 @@ cdef class SigmaZ:
     >>> sig.compute()
     4
     """
-    cdef int n
+    cdef unsigned long long n
     cdef object z
 
-    def __cinit__(self, int n, object z):
+    def __cinit__(self, object n, object z):
         """
         constructor that validating input before storing value
 
@@ -62,14 +640,10 @@ cdef class SigmaZ:
         """
         if n <= 0:
             raise ValueError("only acc positive integer")
-        if isinstance(z, (float, int)):
-            self.z = <double>z
-        elif isinstance(z, complex):
-            self.z = z
-        else:
+        if not isinstance(z, (float, int, complex)):
             raise TypeError("exponent must be numeric")
 
-        self.n = n
+        self.n = <unsigned long long>n
         self.z = z
 
     def __dealloc__(self):
@@ -79,26 +653,50 @@ cdef class SigmaZ:
         """
         compute σ_z(n), the sum of the z-th powers of all positive divisors of n
 
+        n factorized first (wheel trial division + pollard-rho), then:
+            - integer z >= 0 using closed form ∏ (p^((a+1)z) - 1) / (p^z - 1),
+              in 64 bit C arithmetic when the result fit
+            - complex or negative z using product ∏ Σ p^(kz) with cached p^z
+            - other real z summing d^z over divisor generated from factorization
+
+        real z result memoized in module cache, complex z not cached
+        because hashing cost near the compute cost
+
         Return:
             (long): computed value of σ_z(n)
         """
-        cdef int i = 1
-        cdef int oth_div
+        if isinstance(self.z, complex):
+            return self._compute()
+
+        # type part of key, so 2 and 2.0 not sharing entry
+        key = (self.n, type(self.z), self.z)
+        cached = _sigma_cache.get(key)
+        if cached is not None:
+            return cached
+        return _cache_store(_sigma_cache, key, self._compute())
+
+    cdef object _compute(self):
+        cdef list factors = _factor(self.n)
         cdef double z_real
         cdef long total_real = 0
 
-        # when z == 0, just counting number of divisor
-        if self.z == 0:
-            total_real = 0
-            while i * i <= self.n:
-                if self.n % i == 0:
-                    oth_div = self.n // i
-                    if i == oth_div:
-                        total_real += 1  # perfect square
-                    else:
-                        total_real += 2  # two distinct divisor
-                i += 1
-            return total_real
+        # when z == 0, just counting number of divisor τ(n) = ∏ (a + 1)
+        if not isinstance(self.z, complex) and self.z == 0:
+            total = 1
+            for _, a in factors:
+                total *= a + 1
+            return total
+
+        cdef unsigned long long total_c
+        if isinstance(self.z, int) and self.z > 0:
+            # common case stay in 64 bit C arithmetic, python int on overflow
+            if self.z < 64 and not _sigma_int_c(factors, self.z, &total_c):
+                return total_c
+            total = 1
+            for p, a in factors:
+                pz = _cached_pz_int(p, self.z)
+                total *= (pz ** (a + 1) - 1) // (pz - 1)
+            return total
 
         # try convert z to double for optimal compute
         try:
@@ -106,35 +704,25 @@ cdef class SigmaZ:
         except TypeError:
             z_real = -1.0  # mark as invalid for fallback logic
 
-        # if z is numeric and >= 0
+        # if z is real and >= 0
         if z_real >= 0:
-            total_real = 0
-            while i * i <= self.n:
-                if self.n % i == 0:
-                    oth_div = self.n // i
-                    power_i_real = <long>(pow(i, z_real))
-                    power_oth_real = <long>(pow(oth_div, z_real))
-
-                    if i == oth_div:
-                        total_real += power_i_real  # add once for perfect square
-                    else:
-                        total_real += power_i_real + power_oth_real
-                i += 1
+            for d in _divisors(factors):
+                total_real += <long>(pow(<double>d, z_real))
             return total_real
 
-        c_z = <double complex>self.z
-        total_complex = 0
-        i = 1
-        while i * i <= self.n:
-            if self.n % i == 0:
-                oth_div = self.n // i
-                result_c = cpow(<double complex>i, c_z)
-                total_complex += result_c
-
-                if i != oth_div:
-                    result_c = cpow(<double complex>oth_div, c_z)
-                    total_complex += result_c
-            i += 1
+        # σ_z multiplicative, so only p^z need cpow:
+        # σ_z(n) = ∏ (1 + p^z + p^2z + ... + p^az)
+        cdef double complex c_z = <double complex>self.z
+        cdef double complex total_complex = 1
+        cdef double complex pz_c, term, acc
+        for p, a in factors:
+            pz_c = _cached_pz_complex(p, self.z, c_z)
+            term = 1
+            acc = 1
+            for _ in range(a):
+                acc = acc * pz_c
+                term = term + acc
+            total_complex = total_complex * term
         return complex(total_complex)
 
     def __repr__(self):
@@ -170,8 +758,8 @@ cdef class EulerPhi:
     2
 
     Info:
-        - using floating point math to avoid rounding error
-        - safe up to ~n = 10^8 on mostly system
+        - value up to 2^23 read from sieve table shared between instance
+        - larger value fallback into trial division
     """
     cdef public int n
     cdef dict _cache
@@ -186,44 +774,30 @@ cdef class EulerPhi:
         if n < 1:
             raise ValueError("only positive integer are acc")
         self.n = n
-        self._cache
+        self._cache = {}
 
     def __dealloc__(self):
         pass
 
     cpdef int compute(self):
         """
-        compute euler phi using integer arithmetic
+        compute euler phi using lookup into shared totient sieve table,
+        table is building once and grow on demand
 
         Return:
             (int): value of phi(n)
         """
-        if self.n == 1:
-            return 1
-
-        cdef int result = self.n
-        cdef int i = 2
-
-        # handle factor 2 separately
-        if self.n % i == 0:
-            result -= result // i
-            while self.n % i == 0:
-                self.n //= i
-
-        i += 1
-
-        # check odd factors up to sqrt(n)
-        while i * i <= self.n:
-            if self.n % i == 0:
-                result -= result // i
-                while self.n % i == 0:
-                    self.n //= i
-            i += 1
+        # n is public attribute, may be reassigned after __cinit__
+        if self.n < 1:
+            raise ValueError("only positive integer are acc")
+        if self.n > _PHI_SIEVE_LIMIT:
+            cached = _phi_cache.get(self.n)
+            if cached is not None:
+                return cached
+            return _cache_store(_phi_cache, self.n, _phi_trial_division(self.n))
 
-        # if remaining n is a prime > 2, apply one final adjustment
-        if self.n > 1:
-            result -= result // self.n
-        return result
+        _ensure_phi(self.n)
+        return _phi_table[self.n]
 
     def __getitem__(self, int key):
         """
@@ -268,6 +842,24 @@ cdef class EulerPhi:
         return f"EulerPhi({self.n})"
 
 
+cdef int _check_chebyshev_x(double x) except -1:
+    """
+    validate chebyshev bound, x is public attribute so checked again
+    on every compute before cast into table index
+
+    Parameter:
+        x (double): must be finite and >= 2
+    """
+    if not isfinite(x):
+        raise ValueError("x must be finite number")
+    if x < 2:
+        raise ValueError("x must be >= 2")
+    # floor(x) must fit into Py_ssize_t index
+    if x >= 9.2e18:
+        raise OverflowError("currently input to large for computation")
+    return 0
+
+
 cdef class Chebyshev:
     """
     compute chebyshev function ϑ(x), with formula:
@@ -278,7 +870,7 @@ cdef class Chebyshev:
         x (double): upper bound of summation
 
     Methods:
-        compute(): compute ϑ(x) using trial division
+        compute(): compute ϑ(x) using sieve prefix table
         __repr__(): representation of chebyshev function
         __getitem__(key): retrieve cache value or compute it
         __setitem__(key, value): manually cache a compute result
@@ -296,41 +888,43 @@ cdef class Chebyshev:
         initialize chebyshev instance with input validation
 
         Parameter:
-            x (double): must be >= 2
+            x (double): must be finite and >= 2
         """
-        if x < 2:
-            raise ValueError("x must be >= 2")
+        _check_chebyshev_x(x)
         self.x = x
         self._cache = {}
 
     def __dealloc__(self):
-        self._cache.clear()
+        if self._cache is not None:
+            self._cache.clear()
 
     cpdef double compute(self):
         """
         compute the first chebyshev function
 
-        this method using trial divison to check primality
-        then accumulate log(p) for each prime <= floor(x)
+        this method read ϑ(floor(x)) from shared prefix table that built
+        with sieve of eratosthenes, for x beyond table limit using
+        segmented sieve so memory stay O(√x)
+
+        both path accumulate log(p) with kahan compensated summation
 
         Return:
             (double): result of chebyshev functon
         """
-        cdef double result = 0.0
-        cdef int i = 2
-        cdef int limit = <int>self.x
-        cdef int j, is_prime
-
-        while i <= limit:
-            is_prime = 1
-            for j in range(2, <int>sqrt(i) + 1):
-                if i % j == 0:
-                    is_prime = 0
-                    break
-            if is_prime:
-                result += log(i)
-            i += 1
-        return result
+        cdef Py_ssize_t limit
+
+        _check_chebyshev_x(self.x)
+        # compare as double first, cast only once range is known
+        if self.x <= <double>_THETA_SIEVE_LIMIT:
+            limit = <Py_ssize_t>self.x
+            _ensure_theta(limit)
+            return _theta_prefix[limit]
+
+        limit = <Py_ssize_t>self.x
+        cached = _theta_cache.get(limit)
+        if cached is not None:
+            return cached
+        return _cache_store(_theta_cache, limit, _theta_segmented(limit))
 
     def __getitem__(self, double key):
         """
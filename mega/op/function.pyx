@@ -23,9 +23,66 @@
 # cython: language_level=3
 # mega/op/function.pyx
 
+cimport cython
+from cython.parallel cimport prange
 from mega.utils.constant cimport PI_NUMBER, SQRT_PI
-from libc.math cimport sqrt, exp, sin, pow, cos
+from libc.math cimport sqrt, exp, sin, pow, cos, isfinite, NAN
+from libc.complex cimport cpow, csqrt, cabs
 from libc.stdlib cimport malloc, free
+from libc.stdint cimport INT64_MAX
+
+import numpy as np
+
+# bound of memoized compute result, cache cleared when full
+cdef Py_ssize_t _CACHE_MAXSIZE = 100_000
+
+# memoized jordan totient keyed by (n, k)
+cdef dict _jordan_cache = {}
+
+# lanczos coefficient for g = 7, n = 9
+cdef double _LANCZOS_COEFF[9]
+_LANCZOS_COEFF[:] = [
+    0.99999999999980993,
+    676.5203681218851,
+    -1259.1392167224028,
+    771.32342877765313,
+    -176.61502916214059,
+    12.507343278686905,
+    -0.13857109526572012,
+    9.9843695780195716e-6,
+    1.5056327351493116e-7,
+]
+
+
+@cython.cdivision(True)
+cdef double _gamma_c(double z) noexcept nogil:
+    """
+    compute gamma function using lanczos approximation (g = 7)
+    and reflection formula for z < 0.5
+
+    formula:
+        Γ(z) = π / (sin(πz) × Γ(1 - z))                        z < 0.5
+        Γ(z + 1) = √(2π) × t^(z + 0.5) × e^(-t) × A(z)         t = z + 7.5
+
+    Parameter:
+        z (double): point to evaluate
+
+    Return:
+        (double): approximation of Γ(z)
+    """
+    if z < 0.5:
+        return PI_NUMBER / (sin(PI_NUMBER * z) * _gamma_c(1.0 - z))
+
+    cdef int i
+    cdef double x = _LANCZOS_COEFF[0]
+    z -= 1.0
+    for i in range(1, 9):
+        x += _LANCZOS_COEFF[i] / (z + i)
+
+    cdef double t = z + 7.5
+    # split t^(z + 0.5) in two half so large z not overflow before e^(-t)
+    cdef double half = pow(t, 0.5 * (z + 0.5))
+    return sqrt(2.0 * PI_NUMBER) * x * half * (half * exp(-t))
 
 
 def prime_factors(int n, bint unique=False) -> list[int]:
@@ -51,7 +108,7 @@ def prime_factors(int n, bint unique=False) -> list[int]:
     cdef list factors = []
 
     # trie division algorithm
-    while i * i <= n:
+    while i <= n // i:
         while n % i == 0:
             # append current factor
             factors.append(i)
@@ -84,6 +141,7 @@ cdef class Haversine:
 
     Methods
         compute(self) (double): compute haversine(theta)
+        compute_batch(theta) (ndarray): compute haversine for every angle in array
         get_theta(self) (double): get current theta value
         set_theta(self, double new_theta): set new angle in raadians
 
@@ -126,6 +184,38 @@ cdef class Haversine:
         # cosine based definition for avoiding compute square root or power
         return (1.0 - cos(self.theta)) / 2.0
 
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def compute_batch(theta):
+        """
+        compute haversine function for every angle in array
+
+        using sin^2(θ/2) form, more accurate than cosine form near zero,
+        loop run without GIL and split across thread with openmp
+
+        Parameter:
+            theta (array-like): 1d array of angle in radians
+
+        Return:
+            (numpy.ndarray): float64 array, haversine of each angle
+
+        Example:
+        >>> import numpy as np
+        >>> Haversine.compute_batch(np.array([0.0, np.pi]))
+        array([0., 1.])
+        """
+        cdef const double[::1] src = np.ascontiguousarray(theta, dtype=np.float64)
+        cdef Py_ssize_t i, n = src.shape[0]
+        out = np.empty(n, dtype=np.float64)
+        cdef double[::1] dst = out
+        cdef double s
+
+        for i in prange(n, nogil=True):
+            s = sin(src[i] * 0.5)
+            dst[i] = s * s
+        return out
+
     def get_theta(self):
         """
         get the current angle stored in the haversine instance
@@ -156,19 +246,13 @@ cdef class Gamma:
 
     Attribute:
         point (double): input value at witch evaluating gamma function
-        LANCZOS_COEFF (double[8]): coefficient using in lanczos approximation
-        cache (dict): optional dictionary for storing previously computed result for
-                        performance
 
     Example:
     >>> g = Gamma(5.0)
     >>> print(g.compute())
     24.0
     """
-    cdef double z
-    cdef double[8] LANCZOS_COEFF
     cdef double point
-    cdef dict cache
 
     def __cinit__(self, double point) -> None:
         """
@@ -178,16 +262,6 @@ cdef class Gamma:
             point (double): value of z where gamma(z) will be evaluated
                             must be positive real number
         """
-        self.LANCZOS_COEFF = [
-            676.5203681218851,
-            -1259.1392167224028,
-            771.32342877765313,
-            -176.61502916214059,
-            12.507343278686905,
-            -0.13857109526572012,
-            9.9843695780195716e-6,
-            1.5056327351493116e-7
-        ]
         if point <= 0:
             raise ValueError("only positive real number acc")
         if point > 175.5:
@@ -202,45 +276,25 @@ cdef class Gamma:
         this method will be handling:
             - special cases: gamma(n) where n is integer (factorial)
             - half integers like gamma(0.5) = sqrt(pi)
-            - reflection formula for z < 0.5
-            - general case via lanczos approximation
+            - general case via lanczos approximation (reflection for z < 0.5)
 
         Return:
             (double): approximation of gamma(self.point)
         """
         cdef int i
-        cdef double z = self.point
-        cdef double y = z
-        cdef double x = 0.99999999999980993
-        cdef int neg = 0
+        cdef double result
 
         if self.point == 0.5:
             return SQRT_PI
 
-        if self.point == 1.0 or self.point == 2.0:
-            return 1.0
-
         cdef int n = <int>self.point
-        cdef long result
         if self.point == n:
-            result = 1
+            result = 1.0
             for i in range(2, n):
                 result *= i
-            return <double>result
-
-        if z < 0.5:
-            y = 1.0 - z
-            neg = 1
-
-        for i in range(8):
-            x += self.LANCZOS_COEFF[i] / (y + i)
+            return result
 
-        cdef double t = y + 7.5
-        cdef double tmp = sqrt(2.0 * PI_NUMBER) * x * pow(t, y - 0.5) * exp(-t)
-        if neg:
-            return PI_NUMBER / (sin(PI_NUMBER * z) * tmp)
-        else:
-            return tmp
+        return _gamma_c(self.point)
 
     def __repr__(self) -> str:
         computed_value = self.compute()
@@ -262,6 +316,7 @@ cdef class JordanTotient:
 
     Methods:
         compute(): compute jordan totient based on stored value
+        batch(N, k): compute jordan totient for every n in 0..N
         ___repr__(): string representation for debug
         __getitem__(): allow indexing like dictionary
         __setitem__(): manual cache value
@@ -343,33 +398,167 @@ cdef class JordanTotient:
         - for k = 0 return 0
         - general case, compute n^k and applies the formula
 
+        result memoized in module cache keyed by (n, k)
+
         Return:
             (long): value of jordan totient
-        """
+
+        Raise:
+            OverflowError: if Jₖ(n) not fit into 64 bit integer
+        """
+        key = (self.n, self.k)
+        cached = _jordan_cache.get(key)
+        if cached is not None:
+            return cached
+
+        value = self._compute()
+        if value > INT64_MAX:
+            raise OverflowError("jordan totient exceed 64 bit integer range")
+        cdef long result = value
+        if len(_jordan_cache) >= _CACHE_MAXSIZE:
+            _jordan_cache.clear()
+        _jordan_cache[key] = result
+        return result
+
+    cdef object _compute(self):
         if self.k == 0:
             return 0
         if self.n == 1:
             return 1
 
-        cdef long res = <long>(pow(self.n, self.k))
-        cdef list primes = prime_factors(self.n)
+        # exact python int arithmetic, double pow lose precision past 2^53
+        cdef object res = int(self.n) ** self.k
+        cdef object pk
+        # product run over distinct prime, each p | n applied once
+        for p in prime_factors(self.n, unique=True):
+            pk = p ** self.k
+            res = res // pk * (pk - 1)
+        return res
 
-        cdef int p
-        cdef long pk, numerator, denominator
+    @classmethod
+    def batch(cls, int N, int k):
+        """
+        compute jordan totient Jₖ(n) for every n in 0..N
+
+        using numba kernel (smallest prime factor sieve, parallel over n)
+        when numba installed, otherwise fallback into per value compute
+
+        Parameter:
+            N (int): upper bound, inclusive, must be >= 1
+            k (int): exponent, must be non-negative
+
+        Return:
+            (numpy.ndarray): int64 array with length N + 1, index 0 set to 0
+
+        Raise:
+            OverflowError: if any Jₖ(n) not fit into 64 bit integer
+
+        Example:
+        >>> JordanTotient.batch(3, 2)
+        array([0, 1, 3, 8])
+        """
+        if N <= 0:
+            raise ValueError("only positive integers are accepted for N")
+        if k < 0:
+            raise ValueError("exponent k must be non-negative")
+
+        if k == 0:
+            return np.zeros(N + 1, dtype=np.int64)
+
+        try:
+            from mega.op._jordan_numba import jordan_range
+        except ImportError:
+            jordan_range = None
+
+        if jordan_range is not None:
+            out = jordan_range(N, k)
+            # kernel mark overflowed entry with -1, Jₖ(n) always positive
+            if out.min() < 0:
+                raise OverflowError("jordan totient exceed 64 bit integer range")
+            return out
+
+        out = np.zeros(N + 1, dtype=np.int64)
+        cdef int n
+        for n in range(1, N + 1):
+            out[n] = cls(n, k).compute()
+        return out
+
+# upper bound of mobius table, larger n fallback into factorization
+cdef Py_ssize_t _MU_SIEVE_LIMIT = 1 << 23
+
+# module level mobius table packed as int8, _mu_table[n] = μ(n)
+cdef signed char *_mu_table = NULL
+cdef Py_ssize_t _mu_size = 0
+
+
+cdef int _ensure_mu(Py_ssize_t n) except -1:
+    """
+    make sure mobius table covering index n, using linear sieve that
+    compute μ alongside smallest prime factor in single O(N) pass
+
+    table grow geometric (doubling) so repeated call with larger n amortized
+
+    Parameter:
+        n (Py_ssize_t): index that must be available in table
+    """
+    global _mu_table, _mu_size
+
+    if n < _mu_size:
+        return 0
+
+    cdef Py_ssize_t size = max(n + 1, 2 * _mu_size)
+    if size > _MU_SIEVE_LIMIT + 1:
+        size = _MU_SIEVE_LIMIT + 1
+
+    cdef signed char *mu = <signed char*>malloc(size * sizeof(signed char))
+    cdef unsigned char *composite = <unsigned char*>malloc(size * sizeof(unsigned char))
+    cdef int *primes = <int*>malloc((size // 2 + 1) * sizeof(int))
+
+    if not mu or not composite or not primes:
+        free(mu)
+        free(composite)
+        free(primes)
+        raise MemoryError()
+
+    cdef Py_ssize_t i, j, ip
+    cdef Py_ssize_t count = 0
+
+    for i in range(size):
+        composite[i] = 0
+    mu[0] = 0
+    if size > 1:
+        mu[1] = 1
+
+    for i in range(2, size):
+        if not composite[i]:
+            primes[count] = <int>i
+            count += 1
+            mu[i] = -1
+        # every composite crossed exactly once, by its smallest prime factor
+        for j in range(count):
+            ip = i * primes[j]
+            if ip >= size:
+                break
+            composite[ip] = 1
+            if i % primes[j] == 0:
+                mu[ip] = 0
+                break
+            mu[ip] = -mu[i]
+
+    free(composite)
+    free(primes)
+    free(_mu_table)
+    _mu_table = mu
+    _mu_size = size
+    return 0
 
-        for p in primes:
-            pk = <long>pow(p, self.k)
-            numerator = pk - 1
-            denominator = pk
-            res = res // denominator * numerator
-        return res
 
 cpdef int mobius(int n):
     """
     compute mobius function for given positive integer
 
-    this implementing using sieve method to compute mu,
-    based on the smallest prime factor sieve technique
+    value read from shared int8 table built with linear sieve,
+    n beyond table limit computed from prime factorization
 
     Parameter:
         n (int): positive integer >= 1
@@ -384,46 +573,187 @@ cpdef int mobius(int n):
     if n < 1:
         raise ValueError("input must be at least 1")
 
-    cdef int* mu = <int*>malloc((n + 1) * sizeof(int))
-    cdef int* min_prime_factor = <int*>malloc((n + 1) * sizeof(int))
+    if n > _MU_SIEVE_LIMIT:
+        factors = prime_factors(n)
+        if len(factors) != len(set(factors)):
+            return 0
+        return -1 if len(factors) % 2 else 1
 
-    if not mu or not min_prime_factor:
-        free(mu)
-        free(min_prime_factor)
-        raise MemoryError()
+    _ensure_mu(n)
+    return _mu_table[n]
+
+
+def mobius_range(int N):
+    """
+    compute mobius function for every n in 0..N
+
+    usefull for vector work like mobius inversion
+
+    Parameter:
+        N (int): upper bound, inclusive, must be >= 1
+
+    Return:
+        (numpy.ndarray): int8 array with length N + 1, index 0 set to 0
+
+    Example:
+    >>> mobius_range(6)
+    array([ 0,  1, -1, -1,  0, -1,  1], dtype=int8)
+    """
+    if N < 1:
+        raise ValueError("input must be at least 1")
+    if N > _MU_SIEVE_LIMIT:
+        raise ValueError(f"input must be at most {_MU_SIEVE_LIMIT}")
+
+    _ensure_mu(N)
+    return np.asarray(<signed char[:N + 1]>_mu_table).copy()
+
+
+cdef inline double complex _cbrt_c(double complex z) noexcept nogil:
+    # principal complex cube root
+    if z == 0:
+        return 0
+    return cpow(z, 1.0 / 3.0)
 
-    cdef int i, j, p
-
-    for i in range(n + 1):
-        min_prime_factor[i] = 0
-
-    # base case
-    mu[1] = 1
-    # sieve of erathoneses-style looping for fill smallest
-    # prime factors
-    for i in range(2, n + 1):
-        if min_prime_factor[i] == 0:
-            # i is prime number
-            min_prime_factor[i] = i  # marking i as own smallest prime factor
-            j = i
-            # mark all multiple of i that are divisible by i
-            while j <= n:
-                for k in range(j, n + 1, j):
-                    if min_prime_factor[k] == 0:
-                        min_prime_factor[k] = i
-                j *= i
-        # get smallest prime factor of current i
-        p = min_prime_factor[i]
-        # quotient after divide i by p
-        j = i // p
-        if min_prime_factor[j] == p:
-            mu[i] = 0
+
+cdef double complex _resolvent_root(
+    double complex A, double complex B, double complex C
+) noexcept nogil:
+    """
+    solve cubic t³ + At² + Bt + C = 0 using cardano formula and return
+    root with largest magnitude (most stable choice for ferrari method)
+    """
+    cdef double complex P = B - A * A / 3.0
+    cdef double complex Q = 2.0 * A * A * A / 27.0 - A * B / 3.0 + C
+    cdef double complex D = csqrt(Q * Q / 4.0 + P * P * P / 27.0)
+    cdef double complex u = -Q / 2.0 + D
+    cdef double complex v = -Q / 2.0 - D
+    # pick larger branch, avoid cancellation in -Q/2 ± D
+    cdef double complex w = _cbrt_c(u if cabs(u) >= cabs(v) else v)
+    cdef double complex omega = -0.5 + 0.8660254037844386j
+    cdef double complex t, best = 0
+    cdef double best_abs = -1.0
+
+    for _ in range(3):
+        if w == 0:
+            t = -A / 3.0
         else:
-            mu[i] = -mu[j]
-    result = mu[n]
-    free(mu)
-    free(min_prime_factor)
-    return result
+            t = w - P / (3.0 * w) - A / 3.0
+        if cabs(t) > best_abs:
+            best_abs = cabs(t)
+            best = t
+        w = w * omega
+    return best
+
+
+cdef inline double complex _quartic_newton(
+    double complex x, double B, double C, double D, double E
+) noexcept nogil:
+    # one newton step on monic x⁴ + Bx³ + Cx² + Dx + E, polish rounding error
+    cdef double complex f = (((x + B) * x + C) * x + D) * x + E
+    cdef double complex df = ((4.0 * x + 3.0 * B) * x + 2.0 * C) * x + D
+    cdef double complex nxt
+    if df == 0:
+        return x
+    nxt = x - f / df
+    if cabs((((nxt + B) * nxt + C) * nxt + D) * nxt + E) < cabs(f):
+        return nxt
+    return x
+
+
+cdef inline bint _quartic_defined(
+    double a, double b, double c, double d, double e
+) noexcept nogil:
+    # solver need non-zero leading coefficient and finite coefficient
+    return (
+        a != 0 and isfinite(a) and isfinite(b) and isfinite(c)
+        and isfinite(d) and isfinite(e)
+    )
+
+
+cdef bint _quartic_accepted(
+    double a, double b, double c, double d, double e, double complex *out
+) noexcept nogil:
+    """
+    check roots against original coefficient, ferrari lose accuracy when a
+    is tiny relative to other coefficient (b/a, c/a, ... blow up)
+
+    root accepted when backward error |f(x)| / Σ|coef|·|x|ⁱ is small for
+    every root and vieta sum Σx = -b/a hold, non finite value always rejected
+    """
+    cdef double complex x, f, total = 0
+    cdef double ax, scale, spread = 0
+    cdef int i
+
+    for i in range(4):
+        x = out[i]
+        ax = cabs(x)
+        f = (((a * x + b) * x + c) * x + d) * x + e
+        scale = (((abs(a) * ax + abs(b)) * ax + abs(c)) * ax + abs(d)) * ax + abs(e)
+        # written negated so nan/inf fail the test
+        if not (cabs(f) <= 1e-8 * scale):
+            return False
+        total = total + x
+        spread = spread + ax
+    return cabs(total + b / a) <= 1e-8 * (spread + abs(b / a))
+
+
+cdef bint _solve_quartic(
+    double a, double b, double c, double d, double e, double complex *out
+) noexcept nogil:
+    """
+    solve ax⁴ + bx³ + cx² + dx + e = 0 using ferrari method
+
+    step:
+        - depress with x = y - b/(4a) into y⁴ + py² + qy + r = 0
+        - solve resolvent cubic m³ + pm² + (p²/4 - r)m - q²/8 = 0
+        - split into two quadratic with s = √(2m):
+            y² - sy + (p/2 + m + q/(2s)) = 0
+            y² + sy + (p/2 + m - q/(2s)) = 0
+
+    Parameter:
+        a, b, c, d, e (double): coefficient, a must be non-zero
+        out (double complex*): output buffer of 4 roots
+
+    Return:
+        (bint): False when roots fail residual check and need fallback
+    """
+    cdef double B = b / a
+    cdef double C = c / a
+    cdef double D = d / a
+    cdef double E = e / a
+    cdef double shift = B / 4.0
+    cdef double B2 = B * B
+    cdef double p = C - 3.0 * B2 / 8.0
+    cdef double q = D - B * C / 2.0 + B2 * B / 8.0
+    cdef double r = E - B * D / 4.0 + B2 * C / 16.0 - 3.0 * B2 * B2 / 256.0
+    cdef double complex m, s, disc, d1, d2
+    cdef int i
+
+    if q == 0.0:
+        # biquadratic, y² solve as quadratic
+        disc = csqrt(<double complex>(p * p - 4.0 * r))
+        d1 = csqrt((-p + disc) / 2.0)
+        d2 = csqrt((-p - disc) / 2.0)
+        out[0] = d1
+        out[1] = -d1
+        out[2] = d2
+        out[3] = -d2
+    else:
+        m = _resolvent_root(p, p * p / 4.0 - r, -q * q / 8.0)
+        s = csqrt(2.0 * m)
+        d1 = csqrt(-2.0 * p - 2.0 * m - 2.0 * q / s)
+        d2 = csqrt(-2.0 * p - 2.0 * m + 2.0 * q / s)
+        out[0] = (s + d1) / 2.0
+        out[1] = (s - d1) / 2.0
+        out[2] = (-s + d2) / 2.0
+        out[3] = (-s - d2) / 2.0
+
+    for i in range(4):
+        out[i] = out[i] - shift
+        out[i] = _quartic_newton(out[i], B, C, D, E)
+        out[i] = _quartic_newton(out[i], B, C, D, E)
+    return _quartic_accepted(a, b, c, d, e, out)
+
 
 cdef class Quartic:
     """
@@ -432,7 +762,8 @@ cdef class Quartic:
     formula quartic function:
     f(x) = ax⁴ + bx³ + cx² + dx + e
 
-    use horner method for fast and numerical and stable eval
+    use horner method for fast and numerical and stable eval,
+    roots solved with ferrari closed form
 
     Example:
     >>> quar = Quartic(1.0, 2.0, 3.0, 4.0, 5.0)
@@ -492,6 +823,71 @@ cdef class Quartic:
         """
         return self.compute(x)
 
+    def roots(self):
+        """
+        compute the four (complex) roots of f(x) = 0 using ferrari
+        closed form method
+
+        Return:
+            (list[complex]): four roots, repeated root listed multiple time
+
+        Example:
+        >>> sorted(Quartic(1, -10, 35, -50, 24).roots(), key=abs)
+        [(1-0j), (2-0j), (3+0j), (4+0j)]
+        """
+        if self.a == 0:
+            raise ValueError("coefficient a must be non-zero for quartic")
+        if not _quartic_defined(self.a, self.b, self.c, self.d, self.e):
+            raise ValueError("coefficient must be finite number")
+
+        cdef double complex out[4]
+        if not _solve_quartic(self.a, self.b, self.c, self.d, self.e, out):
+            # ill conditioned for closed form, use companion matrix eigenvalue
+            return [complex(x) for x in np.roots(self.coefficient())]
+        return [complex(out[0]), complex(out[1]), complex(out[2]), complex(out[3])]
+
+    @staticmethod
+    def solve_batch(coeffs):
+        """
+        compute roots for many quartic at once, loop run without GIL
+        and split across thread with openmp
+
+        Parameter:
+            coeffs (array-like): shape (N, 5) row of (a, b, c, d, e)
+
+        Return:
+            (numpy.ndarray): complex128 array with shape (N, 4), row with
+                             a == 0 or non finite coefficient filled with nan
+        """
+        cdef const double[:, ::1] src = np.ascontiguousarray(coeffs, dtype=np.float64)
+        if src.shape[1] != 5:
+            raise ValueError("coeffs must have shape (N, 5)")
+
+        cdef Py_ssize_t i, n = src.shape[0]
+        out = np.empty((n, 4), dtype=np.complex128)
+        failed = np.zeros(n, dtype=np.uint8)
+        cdef double complex[:, ::1] dst = out
+        cdef unsigned char[::1] bad = failed
+
+        for i in prange(n, nogil=True):
+            if not _quartic_defined(
+                src[i, 0], src[i, 1], src[i, 2], src[i, 3], src[i, 4]
+            ):
+                dst[i, 0] = NAN
+                dst[i, 1] = NAN
+                dst[i, 2] = NAN
+                dst[i, 3] = NAN
+            elif not _solve_quartic(
+                src[i, 0], src[i, 1], src[i, 2], src[i, 3], src[i, 4], &dst[i, 0]
+            ):
+                bad[i] = 1
+
+        # rows rejected by residual check redo with companion matrix,
+        # only finite row reach here so np.roots never see nan or inf
+        for i in np.flatnonzero(failed):
+            out[i] = np.roots(src[i])
+        return out
+
     def coefficient(self):
         """
         compute current coefficient in order (a, b, c, d, e)
@@ -24,20 +24,132 @@
 # mega/op/tensor.pyx
 
 from libc.stdlib cimport malloc, free
+from libc.string cimport memset
+
+# dtype code, also index into kernel dispatch table
+cdef enum:
+    DTYPE_INT = 0
+    DTYPE_LONG = 1
+    DTYPE_FLOAT = 2
+    DTYPE_DOUBLE = 3
+
+cdef tuple _DTYPE_NAMES = ("int", "long", "float", "double")
+cdef size_t _ITEMSIZE[4]
+_ITEMSIZE[:] = [sizeof(int), sizeof(long), sizeof(float), sizeof(double)]
+
+# element-wise kernel signature, out[i] = a[i] (op) b[i]
+ctypedef void (*binary_kernel)(
+    const void *a, const void *b, void *out, Py_ssize_t n
+) noexcept nogil
+
+
+cdef void _add_int(
+    const void *a, const void *b, void *out, Py_ssize_t n
+) noexcept nogil:
+    cdef const int *x = <const int*>a
+    cdef const int *y = <const int*>b
+    cdef int *z = <int*>out
+    cdef Py_ssize_t i
+    for i in range(n):
+        z[i] = x[i] + y[i]
+
+cdef void _add_long(
+    const void *a, const void *b, void *out, Py_ssize_t n
+) noexcept nogil:
+    cdef const long *x = <const long*>a
+    cdef const long *y = <const long*>b
+    cdef long *z = <long*>out
+    cdef Py_ssize_t i
+    for i in range(n):
+        z[i] = x[i] + y[i]
+
+cdef void _add_float(
+    const void *a, const void *b, void *out, Py_ssize_t n
+) noexcept nogil:
+    cdef const float *x = <const float*>a
+    cdef const float *y = <const float*>b
+    cdef float *z = <float*>out
+    cdef Py_ssize_t i
+    for i in range(n):
+        z[i] = x[i] + y[i]
+
+cdef void _add_double(
+    const void *a, const void *b, void *out, Py_ssize_t n
+) noexcept nogil:
+    cdef const double *x = <const double*>a
+    cdef const double *y = <const double*>b
+    cdef double *z = <double*>out
+    cdef Py_ssize_t i
+    for i in range(n):
+        z[i] = x[i] + y[i]
+
+cdef void _mul_int(
+    const void *a, const void *b, void *out, Py_ssize_t n
+) noexcept nogil:
+    cdef const int *x = <const int*>a
+    cdef const int *y = <const int*>b
+    cdef int *z = <int*>out
+    cdef Py_ssize_t i
+    for i in range(n):
+        z[i] = x[i] * y[i]
+
+cdef void _mul_long(
+    const void *a, const void *b, void *out, Py_ssize_t n
+) noexcept nogil:
+    cdef const long *x = <const long*>a
+    cdef const long *y = <const long*>b
+    cdef long *z = <long*>out
+    cdef Py_ssize_t i
+    for i in range(n):
+        z[i] = x[i] * y[i]
+
+cdef void _mul_float(
+    const void *a, const void *b, void *out, Py_ssize_t n
+) noexcept nogil:
+    cdef const float *x = <const float*>a
+    cdef const float *y = <const float*>b
+    cdef float *z = <float*>out
+    cdef Py_ssize_t i
+    for i in range(n):
+        z[i] = x[i] * y[i]
+
+cdef void _mul_double(
+    const void *a, const void *b, void *out, Py_ssize_t n
+) noexcept nogil:
+    cdef const double *x = <const double*>a
+    cdef const double *y = <const double*>b
+    cdef double *z = <double*>out
+    cdef Py_ssize_t i
+    for i in range(n):
+        z[i] = x[i] * y[i]
+
+# dispatch table indexed by dtype code
+cdef binary_kernel _ADD_KERNELS[4]
+_ADD_KERNELS[DTYPE_INT] = _add_int
+_ADD_KERNELS[DTYPE_LONG] = _add_long
+_ADD_KERNELS[DTYPE_FLOAT] = _add_float
+_ADD_KERNELS[DTYPE_DOUBLE] = _add_double
+
+cdef binary_kernel _MUL_KERNELS[4]
+_MUL_KERNELS[DTYPE_INT] = _mul_int
+_MUL_KERNELS[DTYPE_LONG] = _mul_long
+_MUL_KERNELS[DTYPE_FLOAT] = _mul_float
+_MUL_KERNELS[DTYPE_DOUBLE] = _mul_double
+
 
 cdef class Tensor:
     """
     class of implement tensor
 
+    element stored in one contiguous typed C buffer selected by dtype,
+    element-wise operation run as tight typed loop without the GIL
+
     Attributes:
         shape (int*): pointer to an array storing the dimension of tensor
         ndim (int): number of dimension (rank) of the tensor
         size (int): total number of elements in tensor
-        _dtype (str): data type of the tensor elements
-        int_data (list[int]): python list used when dtype is int
-        long_data (long*): pointer to memory block for `long` type data
-        double_data (double*): pointer memory block for `double` type data
-        float_data (float*): pointer to memory block for `float` type data
+        dtype_code (int): index of data type (int, long, float, double)
+        data (void*): pointer to memory block of `size` elements of dtype
 
     Example:
     >>> tensor1 = Tensor((2, 3), [1, 2, 3, 4, 5, 6], dtype='long')
@@ -49,11 +161,8 @@ cdef class Tensor:
     cdef int *shape
     cdef int ndim
     cdef int size
-    cdef str _dtype
-    cdef object int_data
-    cdef long *long_data
-    cdef double *double_data
-    cdef float *float_data
+    cdef int dtype_code
+    cdef void *data
 
     def __cinit__(self, tuple shape, list data=None, str dtype="long"):
         """
@@ -65,9 +174,10 @@ cdef class Tensor:
             dtype (str, optional): data type of the tensor, supported type
                                     long, int, float, double, default was long
         """
-        self._dtype = dtype.lower()
-        if self._dtype not in ("int", "long", "double", "float"):
+        dtype = dtype.lower()
+        if dtype not in _DTYPE_NAMES:
             raise ValueError(f"unsupported dtype: {dtype}")
+        self.dtype_code = _DTYPE_NAMES.index(dtype)
 
         self.ndim = len(shape)
         self.shape = <int*>malloc(self.ndim * sizeof(int))
@@ -83,44 +193,14 @@ cdef class Tensor:
             self.shape[i] = dim
             self.size *= dim
 
-        if self._dtype == "int":
-            self.int_data = [0] * self.size
-            if data is not None:
-                for i in range(min(self.size, len(data))):
-                    self.int_data[i] = data[i]
-
-        elif self._dtype == "long":
-            self.long_data = <long*>malloc(self.size * sizeof(long))
-            if not self.long_data:
-                raise MemoryError("failed to allocate long data")
-            if data is None:
-                for i in range(self.size):
-                    self.long_data[i] = 0
-            else:
-                for i in range(self.size):
-                    self.long_data[i] = data[i]
-
-        elif self._dtype == "double":
-            self.double_data = <double*>malloc(self.size * sizeof(double))
-            if not self.double_data:
-                raise MemoryError("failed to allocate double data")
-            if data is None:
-                for i in range(self.size):
-                    self.double_data[i] = 0.0
-            else:
-                for i in range(self.size):
-                    self.float_data[i] = <double>data[i]
-
-        elif self._dtype == "float":
-            self.float_data = <float*>malloc(self.size * sizeof(float))
-            if not self.float_data:
-                raise MemoryError("failed to allocate float data")
-            if data is None:
-                for i in range(self.size):
-                    self.float_data[i] = 0.0
-            else:
-                for i in range(self.size):
-                    self.float_data[i] = <float>data[i]
+        self.data = malloc(self.size * _ITEMSIZE[self.dtype_code])
+        if not self.data:
+            raise MemoryError(f"failed to allocate {dtype} data")
+        memset(self.data, 0, self.size * _ITEMSIZE[self.dtype_code])
+
+        if data is not None:
+            for i in range(min(self.size, len(data))):
+                self._set_value(i, data[i])
 
     def __dealloc__(self):
         """
@@ -132,29 +212,31 @@ cdef class Tensor:
         if self.shape is not NULL:
             free(self.shape)
             self.shape = NULL
-        if self._dtype == "long" and self.long_data is not NULL:
-            free(<void*>self.long_data)
-            self.long_data = NULL
-        elif self._dtype == "double" and self.double_data is not NULL:
-            free(<void*>self.double_data)
-            self.double_data = NULL
-        elif self._dtype == "float" and self.float_data is not NULL:
-            free(<void*>self.float_data)
-            self.float_data = NULL
-        if hasattr(self, "int_data") and self.int_data is not None:
-            self.int_data.clear()
+        if self.data is not NULL:
+            free(self.data)
+            self.data = NULL
         self.ndim = 0
         self.size = 0
 
-    cdef _get_value(self, int index):
-        if self._dtype == "int":
-            return self.int_data[index]
-        elif self._dtype == "long":
-            return self.long_data[index]
-        elif self._dtype == "double":
-            return self.double_data[index]
-        elif self._dtype == "float":
-            return self.float_data[index]
+    cdef _get_value(self, Py_ssize_t index):
+        if self.dtype_code == DTYPE_INT:
+            return (<int*>self.data)[index]
+        elif self.dtype_code == DTYPE_LONG:
+            return (<long*>self.data)[index]
+        elif self.dtype_code == DTYPE_FLOAT:
+            return (<float*>self.data)[index]
+        else:
+            return (<double*>self.data)[index]
+
+    cdef _set_value(self, Py_ssize_t index, object value):
+        if self.dtype_code == DTYPE_INT:
+            (<int*>self.data)[index] = value
+        elif self.dtype_code == DTYPE_LONG:
+            (<long*>self.data)[index] = value
+        elif self.dtype_code == DTYPE_FLOAT:
+            (<float*>self.data)[index] = value
+        else:
+            (<double*>self.data)[index] = value
 
     def tolist(self):
         """
@@ -238,7 +320,7 @@ cdef class Tensor:
         Return:
             str: data type string (int, long, float, or double)
         """
-        return self._dtype
+        return _DTYPE_NAMES[self.dtype_code]
 
     def __getitem__(self, object idxs):
         """
@@ -270,14 +352,7 @@ cdef class Tensor:
                 raise IndexError(f"Index out of bounds at axis {i}: {pos}")
             offset += pos * self._compute_stride(i)
 
-        if self._dtype == "int":
-            return self.int_data[offset]
-        elif self._dtype == "long":
-            return self.long_data[offset]
-        elif self._dtype == "double":
-            return self.double_data[offset]
-        elif self._dtype == "float":
-            return self.float_data[offset]
+        return self._get_value(offset)
 
     def __setitem__(self, object idxs, long value):
         """
@@ -307,14 +382,7 @@ cdef class Tensor:
                 raise IndexError(f"Index out of bounds at axis {i}: {pos}")
             offset += pos * self._compute_stride(i)
 
-        if self._dtype == "int":
-            self.int_data[offset] = value
-        elif self._dtype == "long":
-            self.long_data[offset] = value
-        elif self._dtype == "double":
-            self.double_data[offset] = value
-        elif self._dtype == "float":
-            self.float_data[offset] = value
+        self._set_value(offset, value)
 
     cdef long _compute_stride(self, int axis):
         """
@@ -334,71 +402,88 @@ cdef class Tensor:
             stride *= self.shape[i]
         return stride
 
-    cpdef Tensor add(self, Tensor other):
+    cdef Tensor _binary_op(
+        self, Tensor other, Tensor out, binary_kernel kernel, str op_name
+    ):
         """
-        perform element-wise add between two tensor of same shape
+        validate operand then run element-wise kernel into out buffer,
+        allocate new result tensor only when out not given
+
+        Parameter:
+            other (Tensor): right operand
+            out (Tensor or None): destination tensor, may be self or other
+            kernel (binary_kernel): typed loop for current dtype
+            op_name (str): operation name for error message
 
         Return:
-            (Tensor): new tensor after element-wise add
+            (Tensor): tensor holding the result
         """
         if self.size != other.size:
             raise ValueError("tensor must have the same number of elements")
 
-        if self._dtype != other._dtype:
-            raise TypeError("data type must match for add operation")
+        if self.dtype_code != other.dtype_code:
+            raise TypeError(f"data type must match for {op_name} operation")
 
-        cdef Tensor result = Tensor(
-            tuple([self.shape[i] for i in range(self.ndim)]), dtype=self._dtype
-        )
-        cdef int i
+        if out is None:
+            out = Tensor(
+                tuple([self.shape[i] for i in range(self.ndim)]), dtype=self.dtype()
+            )
+        elif out.size != self.size:
+            raise ValueError("out tensor must have the same number of elements")
+        elif out.dtype_code != self.dtype_code:
+            raise TypeError(f"out tensor data type must match for {op_name} operation")
 
-        if self._dtype == "int":
-            for i in range(self.size):
-                result.int_data[i] = self.int_data[i] + other.int_data[i]
-        elif self._dtype == "long":
-            for i in range(self.size):
-                result.long_data[i] = self.long_data[i] + other.long_data[i]
-        elif self._dtype == "double":
-            for i in range(self.size):
-                result.double_data[i] = self.double_data[i] + other.double_data[i]
-        elif self._dtype == "float":
-            for i in range(self.size):
-                result.float_data[i] = self.float_data[i] + other.float_data[i]
-        return result
+        with nogil:
+            kernel(self.data, other.data, out.data, self.size)
+        return out
+
+    cpdef Tensor add(self, Tensor other, Tensor out=None):
+        """
+        perform element-wise add between two tensor of same shape
+
+        Parameter:
+            other (Tensor): tensor to add
+            out (Tensor, optional): preallocated tensor to write result into,
+                                    reuse its buffer instead allocate new one
+
+        Return:
+            (Tensor): new tensor after element-wise add, or `out` when given
+        """
+        return self._binary_op(other, out, _ADD_KERNELS[self.dtype_code], "add")
 
-    cpdef Tensor multiply(self, Tensor other):
+    cpdef Tensor multiply(self, Tensor other, Tensor out=None):
         """
         perform element-wise multiply two tensor of same shape
 
+        Parameter:
+            other (Tensor): tensor to multiply
+            out (Tensor, optional): preallocated tensor to write result into,
+                                    reuse its buffer instead allocate new one
+
         Return:
-            (Tensor): new Tensor after element-wise multiply
+            (Tensor): new Tensor after element-wise multiply, or `out` when given
         """
-        if self.size != other.size:
-            raise ValueError("tensor must have same number oof elements")
+        return self._binary_op(other, out, _MUL_KERNELS[self.dtype_code], "multiply")
 
-        if self._dtype != other._dtype:
-            raise TypeError("data type must match for multiply operation")
+    def add_(self, Tensor other):
+        """
+        in-place element-wise add, result written into this tensor
 
-        cdef Tensor result = Tensor(
-            tuple([self.shape[i] for i in range(self.ndim)]),
-            dtype=self._dtype
-        )
-        cdef int i
+        return self so operation can be chained, like x.add_(y).multiply_(z)
 
-        if self._dtype == "int":
-            for i in range(self.size):
-                result.int_data[i] = self.int_data[i] * other.int_data[i]
-        elif self._dtype == "long":
-            for i in range(self.size):
-                result.long_data[i] = self.long_data[i] * other.long_data[i]
-        elif self._dtype == "double":
-            for i in range(self.size):
-                result.double_data[i] = self.double_data[i] * other.double_data[i]
-        elif self._dtype == "float":
-            for i in range(self.size):
-                result.float_data[i] = self.float_data[i] * other.float_data[i]
+        Return:
+            (Tensor): this tensor
+        """
+        return self.add(other, out=self)
 
-        return result
+    def multiply_(self, Tensor other):
+        """
+        in-place element-wise multiply, result written into this tensor
+
+        Return:
+            (Tensor): this tensor
+        """
+        return self.multiply(other, out=self)
 
     def __repr__(self):
         """
@@ -411,24 +496,17 @@ cdef class Tensor:
         shape_str = ", ".join(shape_list)
 
         data_preview = []
-        if self._dtype == "int":
-            for i in range(min(5, self.size)):
-                data_preview.append(str(self.int_data[i]))
-        elif self._dtype == "long":
-            for i in range(min(5, self.size)):
-                data_preview.append(str(self.long_data[i]))
-        elif self._dtype == "double":
-            for i in range(min(5, self.size)):
-                data_preview.append(f"{self.double_data[i]:.4f}")
-        elif self._dtype == "float":
-            for i in range(min(5, self.size)):
-                data_preview.append(f"{self.float_data[i]:.4f}")
+        for i in range(min(5, self.size)):
+            if self.dtype_code == DTYPE_INT or self.dtype_code == DTYPE_LONG:
+                data_preview.append(str(self._get_value(i)))
+            else:
+                data_preview.append(f"{self._get_value(i):.4f}")
 
         data_str = ", ".join(data_preview)
         if self.size > 50:
             data_str += ", ..."
 
-        return f"Tensor(shape=({shape_str}), dtype={self._dtype}, data=[{data_str}])"
+        return f"Tensor(shape=({shape_str}), dtype={self.dtype()}, data=[{data_str}])"
 
     def __str__(self):
         return self.__repr__()
@@ -30,79 +30,26 @@ cdef double TAU_NUMBERS = PI_NUMBER * 2
 cdef double SQRT_PI = 1.772453850905516027298167483341145182
 
 
-cdef void mat_mult(
-    unsigned long A[2][2],
-    unsigned long B[2][2],
-    unsigned long result[2][2]
-) except *:
-    """
-    multiply 2x2 matrices A B, and storing in result variable
+# soft cap for memoized sequence, index past this computed on the fly
+# from last cached term so memory stay bounded
+cdef Py_ssize_t _SEQUENCE_CACHE_LIMIT = 10_000
 
-    formula:
-        [ a00 a01 ]   [ b00 b01 ]   [ a00*b00 + a01*b10   a00*b01 + a01*b11 ]
-        [ a10 a11 ] × [ b10 b11 ] = [ a10*b00 + a11*b10   a10*b01 + a11*b11 ]
+# memoized lucas and catalan sequence, only extended with missing tail
+cdef list _lucas_cache = [2, 1]
+cdef list _catalan_cache = [1]
 
-    Parameter:
-        A (unsigned long[2][2]): first input 2x2 matrices
-        B (unsigned long[2][2]): second input 2x2 matrices
-        result (unsigned long[2][2]): output matrices to storing the product
-    """
-    # top left element result matrices
-    result[0][0] = A[0][0] * B[0][0] + A[0][1] * B[1][0]
-    # top right element result matrices
-    result[0][1] = A[0][0] * B[0][1] + A[0][1] * B[1][1]
-    # bottom left element of result matrices
-    result[1][0] = A[1][0] * B[0][0] + A[1][1] * B[1][0]
-    # bottom right element of result matrices
-    result[1][1] = A[1][0] * B[0][1] + A[1][1] * B[1][1]
-
-cdef void mat_pow(
-    unsigned long M[2][2],
-    int power,
-    unsigned long result[2][2]
-) except *:
-    """
-    raise 2x2 matrice to given power using binary exponent
 
-    Parameter:
-        M (unsigned long[2][2]): input 2x2 matrices to be raise to power
-        power (int): non-negative integer exponent
-        result (unsigned long[2][2]): output matrix where the result will stored
-    """
-    result[0][0] = 1
-    result[0][1] = 0
-    result[1][0] = 0
-    result[1][1] = 1
-
-    cdef unsigned long temp[2][2]
-
-    while power > 0:
-        if power % 2 == 1:
-            mat_mult(result, M, temp)
-            # inline copy back to the res to avoid extra function call
-            result[0][0] = temp[0][0]
-            result[0][1] = temp[0][1]
-            result[1][0] = temp[1][0]
-            result[1][1] = temp[1][1]
-        # square current matrix M
-        mat_mult(M, M, temp)
-        M[0][0] = temp[0][0]
-        M[0][1] = temp[0][1]
-        M[1][0] = temp[1][0]
-        M[1][1] = temp[1][1]
-        # halve power
-        power //= 2
-
-
-cpdef unsigned long lucas_number(int n) except 0:
+cpdef object lucas_number(Py_ssize_t n):
     """
-    compute the nth lucas number using iterative
+    compute the nth lucas number using memoized recurrence
+
+    L0 = 2, L1 = 1, Lk = Lk-1 + Lk-2
 
     Parameter:
         n (int): index in the lucas squence, must be non-negative integers
 
     Return:
-        (unsigned long): the nth lucas number
+        (int): the nth lucas number
 
     Example:
     >>> lucas_number(0)
@@ -110,46 +57,29 @@ cpdef unsigned long lucas_number(int n) except 0:
     >>> lucas_number(40)
     228826127
     """
-    cdef unsigned long prev = 2, curr = 1, next_val
-    cdef int i
-    cdef unsigned long res[2][2]
-    cdef int power
-    cdef unsigned long F[2][2]
-    F[0][0] = 1
-    F[0][1] = 1
-    F[1][0] = 1
-    F[1][1] = 0
-
     if n < 0:
         raise ValueError("index must be non negative number")
 
-    if not isinstance(n, int):
-        raise TypeError("num must be integer non-negative types")
-    elif isinstance(n, float):
-        n = <int>n
+    cdef Py_ssize_t size = len(_lucas_cache)
+    if n < size:
+        return _lucas_cache[n]
 
-    if n == 0:
-        return 2
-    elif n == 1:
-        return 1
-
-    if n <= 20:
-        for i in range(2, n + 1):
-            next_val = prev + curr
-            # shifting previous value forward
-            prev = curr
-            # update current value for next iteration
-            curr = next_val
-        return curr
-
-    else:
-        power = n - 1
-        mat_pow(F, power, res)
-        return 2 * res[0][1] + res[0][0]
-
-cpdef long catalan_number(int n) except -1:
+    cdef Py_ssize_t i, _
+    for i in range(size, min(n, _SEQUENCE_CACHE_LIMIT) + 1):
+        _lucas_cache.append(_lucas_cache[i - 1] + _lucas_cache[i - 2])
+    if n <= _SEQUENCE_CACHE_LIMIT:
+        return _lucas_cache[n]
+
+    # past the cap, continue recurrence without storing
+    prev = _lucas_cache[_SEQUENCE_CACHE_LIMIT - 1]
+    curr = _lucas_cache[_SEQUENCE_CACHE_LIMIT]
+    for _ in range(_SEQUENCE_CACHE_LIMIT, n):
+        prev, curr = curr, prev + curr
+    return curr
+
+cpdef object catalan_number(Py_ssize_t n):
     """
-    compute the nth catalan number using efficient iterative algorithm
+    compute the nth catalan number using memoized iterative algorithm
 
     catalan number are squence natural numbers that appear in many combine
 
@@ -161,7 +91,7 @@ cpdef long catalan_number(int n) except -1:
         n (int): index of catalan number to compute must be >= 0
 
     Return:
-        (long): nth catalan number
+        (int): nth catalan number
 
     Example:
     >>> catalan_number(0)
@@ -172,28 +102,58 @@ cpdef long catalan_number(int n) except -1:
     if n < 0:
         raise ValueError("index must be a non-negative integer")
 
-    if not isinstance(n, int):
-        raise TypeError("num must be integer, only acc integer non-negative")
-    elif isinstance(n, float):
-        n = <int>n
-
-    cdef long result = 1
-    cdef int i
+    cdef Py_ssize_t size = len(_catalan_cache)
+    if n < size:
+        return _catalan_cache[n]
 
+    cdef Py_ssize_t i
     # C(i) = C(i-1) * 2*(2i - 1) // (i + 1)
-    for i in range(1, n + 1):
-        # multiple current result by 2*(2i - 1)
-        # then divide by (i + 1) using integer division
+    for i in range(size, min(n, _SEQUENCE_CACHE_LIMIT) + 1):
+        _catalan_cache.append(_catalan_cache[i - 1] * 2 * (2 * i - 1) // (i + 1))
+    if n <= _SEQUENCE_CACHE_LIMIT:
+        return _catalan_cache[n]
+
+    # past the cap, continue recurrence without storing
+    result = _catalan_cache[_SEQUENCE_CACHE_LIMIT]
+    for i in range(_SEQUENCE_CACHE_LIMIT + 1, n + 1):
         result = result * 2 * (2 * i - 1) // (i + 1)
     return result
 
-cpdef double golden_ratio(int iteration=30) except -1.0:
+# ratio F(k+1) / F(k) equal to golden ratio in double precision for
+# every k past this, so larger iteration reuse this index
+cdef int _GOLDEN_RATIO_CONVERGED = 80
+
+
+cdef tuple _fib_pair(unsigned long long n):
     """
-    compute golden ratio using interative continued fraction
+    compute pair (F(n), F(n+1)) using fast doubling
+
+    formula:
+        F(2k)   = F(k) × (2F(k+1) - F(k))
+        F(2k+1) = F(k)² + F(k+1)²
 
-    golden ratio formula
+    Parameter:
+        n (unsigned long long): index of fibonacci number
+
+    Return:
+        (tuple[int, int]): F(n) and F(n + 1)
+    """
+    if n == 0:
+        return (0, 1)
+    a, b = _fib_pair(n >> 1)
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    if n & 1:
+        return (d, c + d)
+    return (c, d)
+
+
+cpdef double golden_ratio(int iteration=30) except -1.0:
+    """
+    compute golden ratio using fibonacci convergent
 
-    gold = 1 + 1 / gold
+    continued fraction gold = 1 + 1 / gold after k iteration (start from 1)
+    equal to F(k+2) / F(k+1), both computed in one fast doubling call
 
     Parameter:
         iteration (int): number of iteration to refining approximation
@@ -212,12 +172,9 @@ cpdef double golden_ratio(int iteration=30) except -1.0:
     if iteration < 1:
         raise ValueError("iteration must be at least 1")
 
-    # initial approximation
-    cdef double phi = 1.0
-    cdef int i
+    if iteration > _GOLDEN_RATIO_CONVERGED:
+        iteration = _GOLDEN_RATIO_CONVERGED
 
-    # using continued fraction fromula
-    # phi = 1 + 1 / phi
-    for i in range(iteration):
-        phi = 1.0 + 1.0 / phi
-    return phi
+    fk, fk_next = _fib_pair(iteration + 1)
+    # true division of python int is correctly rounded
+    return fk_next / fk
@@ -2,24 +2,106 @@ from setuptools import Extension, find_packages, setup
 from Cython.Build import cythonize
 import numpy as np
 import os
+import platform
+import shutil
+import sysconfig
+import tempfile
+
+# route compiler through ccache when available, so rebuild without
+# change in generated C source was cache hit
+if shutil.which("ccache") and "CC" not in os.environ:
+    os.environ["CC"] = f"ccache {sysconfig.get_config_var('CC') or 'cc'}"
+
+
+def openmp_supported() -> bool:
+    """
+    check compiler accept -fopenmp by compiling and linking small program,
+    apple clang for example reject the flag, then prange just run serially
+    """
+    if os.name == "nt":
+        return False
+
+    # stdlib distutils removed in python 3.12, use copy vendored by setuptools
+    from setuptools._distutils.ccompiler import new_compiler
+    from setuptools._distutils.errors import CompileError, LinkError
+    from setuptools._distutils.sysconfig import customize_compiler
+
+    compiler = new_compiler()
+    customize_compiler(compiler)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "check_openmp.c")
+        with open(source, "w") as f:
+            f.write(
+                "#include <omp.h>\nint main(void) { return omp_get_max_threads() < 1; }\n"
+            )
+        try:
+            objects = compiler.compile(
+                [source], output_dir=tmp, extra_postargs=["-fopenmp"]
+            )
+            compiler.link_executable(
+                objects, os.path.join(tmp, "check_openmp"), extra_postargs=["-fopenmp"]
+            )
+        except (CompileError, LinkError):
+            return False
+    return True
+
+
+def native_compile_args() -> list[str]:
+    """
+    optimization flags for extension build, tuned for build host cpu
+
+    -march=native on x86, -mcpu=native on arm, nothing extra on msvc,
+    set MEGA_NATIVE=0 for portable build (wheel run on other machine)
+    """
+    if os.name == "nt":
+        return []
+    args = ["-O3", "-funroll-loops"]
+    if os.environ.get("MEGA_NATIVE", "1") == "0":
+        return args
+    machine = platform.machine().lower()
+    if machine in ("x86_64", "amd64", "i386", "i686"):
+        args.append("-march=native")
+    elif machine in ("arm64", "aarch64") or machine.startswith("arm"):
+        args.append("-mcpu=native")
+    return args
+
+
+openmp_args = ["-fopenmp"] if openmp_supported() else []
+compile_args = native_compile_args() + openmp_args
+link_args = openmp_args
+define_macros = [("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")]
 
 ext = [
     Extension(
         "mega.op.arithmethic",
         ["mega/op/arithmethic.pyx"],
         include_dirs=[np.get_include()],
+        extra_compile_args=compile_args,
+        extra_link_args=link_args,
+        define_macros=define_macros,
     ),
     Extension(
         "mega.op.function",
         ["mega/op/function.pyx"],
         include_dirs=[np.get_include()],
+        extra_compile_args=compile_args,
+        extra_link_args=link_args,
+        define_macros=define_macros,
     ),
     Extension(
-        "mega.op.tensor", ["mega/op/tensor.pyx"], include_dirs=[np.get_include()]
+        "mega.op.tensor",
+        ["mega/op/tensor.pyx"],
+        include_dirs=[np.get_include()],
+        extra_compile_args=compile_args,
+        extra_link_args=link_args,
+        define_macros=define_macros,
     ),
     Extension(
         "mega.utils.constant",
         ["mega/utils/constant.pyx"],
+        extra_compile_args=compile_args,
+        extra_link_args=link_args,
+        define_macros=define_macros,
     ),
 ]
 
@@ -30,6 +112,16 @@ setup(
     name="mega number utils",
     version="1.0",
     packages=find_packages(),
-    ext_modules=cythonize(ext, language_level=3),
+    ext_modules=cythonize(
+        ext,
+        language_level=3,
+        nthreads=os.cpu_count() or 1,
+        compiler_directives={
+            "boundscheck": False,
+            "wraparound": False,
+            "cdivision": True,
+            "initializedcheck": False,
+        },
+    ),
     include_dirs=[np.get_include()],
 )
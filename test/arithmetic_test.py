@@ -57,29 +57,27 @@ CHEBYSHEV_VALUE: list = [
 ]
 
 
-def test_value_sigma() -> None:
-    for n, z, expected in SIGMA_VALUES:
-        sigma = mega.SigmaZ(n, z)
-        result = sigma.compute()
-        assert (
-            result == expected
-        ), f"SigmaZ({n}, {z}) -> {result}, expected = {expected}"
+@pytest.mark.parametrize("n,z,expected", SIGMA_VALUES)
+def test_value_sigma(n, z, expected) -> None:
+    sigma = mega.SigmaZ(n, z)
+    result = sigma.compute()
+    assert result == expected, f"SigmaZ({n}, {z}) -> {result}, expected = {expected}"
 
 
-def test_value_complex_sigma() -> None:
+@pytest.mark.parametrize("n,z,expected", SIGMA_COMPLEX_VALUES)
+def test_value_complex_sigma(n, z, expected) -> None:
     import numpy as np
 
-    for n, z, expected in SIGMA_COMPLEX_VALUES:
-        sigma = mega.SigmaZ(n, z)
-        result = sigma.compute()
+    sigma = mega.SigmaZ(n, z)
+    result = sigma.compute()
 
-        assert isinstance(
-            result, complex
-        ), f"Expected complex output for SigmaZ({n}, {z}), got {type(result)}"
+    assert isinstance(
+        result, complex
+    ), f"Expected complex output for SigmaZ({n}, {z}), got {type(result)}"
 
-        assert np.isclose(result, expected, atol=1e-10), (
-            f"SigmaZ({n}, {z}) → {result}, " f"expected {expected}"
-        )
+    assert np.isclose(result, expected, atol=1e-10), (
+        f"SigmaZ({n}, {z}) → {result}, " f"expected {expected}"
+    )
 
 
 def test_perfect_square_sigma() -> None:
@@ -95,13 +93,64 @@ def test_large_input_sigma() -> None:
     assert sig.compute() == 2340
 
 
-def test_value_euler_phi() -> None:
-    for n, expected in EULER_PHI_VALUE:
-        phi = mega.EulerPhi(n)
-        result = phi.compute()
-        assert (
-            result == expected
-        ), f"EulerPhi({n}).compute() -> {result}, expected {expected}"
+def test_large_prime_factor_sigma() -> None:
+    # both prime factor beyond trial division bound, factorized by pollard-rho
+    p: int = 4294967291
+    q: int = 4294967279
+    assert mega.SigmaZ(p * q, 1).compute() == (p + 1) * (q + 1)
+    assert mega.SigmaZ(p * q, 0).compute() == 4
+    assert mega.SigmaZ(2**61 - 1, 1).compute() == 2**61
+    assert mega.SigmaZ(2**64 - 1, 0).compute() == 128
+
+
+def test_64bit_boundary_sigma() -> None:
+    # result fit exactly in 64 bit, or just overflow and fallback python int
+    assert mega.SigmaZ(2**63, 1).compute() == 2**64 - 1
+    assert mega.SigmaZ(2, 64).compute() == 2**64 + 1
+    assert mega.SigmaZ(2**64 - 1, 1).compute() == 31421980989189888768
+    assert mega.SigmaZ(7, 30).compute() == 7**30 + 1
+
+
+def test_negative_exponent_sigma() -> None:
+    import numpy as np
+
+    result = mega.SigmaZ(12, -1).compute()
+    assert isinstance(result, complex)
+    assert np.isclose(result, sum(1 / d for d in (1, 2, 3, 4, 6, 12)), atol=1e-12)
+
+
+@pytest.mark.parametrize("n,expected", EULER_PHI_VALUE)
+def test_value_euler_phi(n, expected) -> None:
+    phi = mega.EulerPhi(n)
+    result = phi.compute()
+    assert (
+        result == expected
+    ), f"EulerPhi({n}).compute() -> {result}, expected {expected}"
+
+
+def test_getitem_cache_euler_phi() -> None:
+    phi = mega.EulerPhi(10)
+    assert phi[6] == 2
+    assert phi[9] == 6
+    phi[6] = 99
+    assert phi[6] == 99
+
+
+def test_repeated_compute_sigma() -> None:
+    # memoized result must not leak between integer and float exponent
+    for _ in range(3):
+        expected = (4**13 - 1) // 3 * ((25**13 - 1) // 24)
+        assert mega.SigmaZ(10**12, 2).compute() == expected
+        assert isinstance(mega.SigmaZ(10**12, 2).compute(), int)
+        assert mega.SigmaZ(12, 2.0).compute() == 210
+
+
+@pytest.mark.parametrize("n", [0, -1, -100_000_000])
+def test_invalid_attribute_euler_phi(n) -> None:
+    phi = mega.EulerPhi(10)
+    phi.n = n
+    with pytest.raises(ValueError):
+        phi.compute()
 
 
 def test_invalid_euler_phi() -> None:
@@ -109,20 +158,25 @@ def test_invalid_euler_phi() -> None:
         mega.EulerPhi(0)
 
 
-def test_case_prime_euler_phi() -> None:
-    primes: list[int] = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
-    for p in primes:
-        phi = mega.EulerPhi(p)
-        assert phi.compute() == p - 1, f"phi({p}) should -> {p - 1}"
+def test_prime_near_int_max_euler_phi() -> None:
+    # 2^31 - 1 prime, trial division loop bound must not overflow int
+    assert mega.EulerPhi(2_147_483_647).compute() == 2_147_483_646
+    assert mega.EulerPhi(2_147_483_629).compute() == 2_147_483_628
+
 
+@pytest.mark.parametrize("p", [2, 3, 5, 7, 11, 13, 17, 19, 23, 29])
+def test_case_prime_euler_phi(p) -> None:
+    phi = mega.EulerPhi(p)
+    assert phi.compute() == p - 1, f"phi({p}) should -> {p - 1}"
 
-def test_perfect_power_euler_phi() -> None:
+
+@pytest.mark.parametrize("k", range(1, 6))
+def test_perfect_power_euler_phi(k) -> None:
     p: int = 2
-    for k in range(1, 6):
-        power = p**k
-        expected = power - (p ** (k - 1))
-        phi = mega.EulerPhi(power)
-        assert phi.compute() == expected, f"phi({power}) should be {expected}"
+    power = p**k
+    expected = power - (p ** (k - 1))
+    phi = mega.EulerPhi(power)
+    assert phi.compute() == expected, f"phi({power}) should be {expected}"
 
 
 def test_large_input_euler_phi() -> None:
@@ -130,11 +184,25 @@ def test_large_input_euler_phi() -> None:
     assert phi.compute() == 400_000
 
 
-def test_value_chebyshev() -> None:
-    for x, expected in CHEBYSHEV_VALUE:
-        ch = mega.Chebyshev(x)
-        result = ch.compute()
-        assert result == pytest.approx(expected, abs=1e-5), f"Chebyshev({x}).compute()"
+def test_sieve_growth_euler_phi() -> None:
+    # smaller query after larger one must read from same grown table
+    assert mega.EulerPhi(97).compute() == 96
+    assert mega.EulerPhi(2_000_003).compute() == 2_000_002
+    assert mega.EulerPhi(36).compute() == 12
+
+
+def test_beyond_sieve_limit_euler_phi() -> None:
+    # 2 * 3 * 7 * 11 * 13 * 41 * 61 = 15_021_006 > sieve table limit
+    n: int = 2 * 3 * 7 * 11 * 13 * 41 * 61
+    expected: int = 1 * 2 * 6 * 10 * 12 * 40 * 60
+    assert mega.EulerPhi(n).compute() == expected
+
+
+@pytest.mark.parametrize("x,expected", CHEBYSHEV_VALUE)
+def test_value_chebyshev(x, expected) -> None:
+    ch = mega.Chebyshev(x)
+    result = ch.compute()
+    assert result == pytest.approx(expected, abs=1e-5), f"Chebyshev({x}).compute()"
 
 
 def test_edge_cases_chebyshev() -> None:
@@ -144,6 +212,61 @@ def test_edge_cases_chebyshev() -> None:
     )
 
 
+def test_prefix_table_chebyshev() -> None:
+    # query larger bound first, smaller bound must reuse same prefix table
+    large = mega.Chebyshev(1000.0).compute()
+    small = mega.Chebyshev(30.5).compute()
+    primes: list[int] = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    assert small == pytest.approx(sum(math.log(p) for p in primes), abs=1e-10)
+    assert large == pytest.approx(956.245265, abs=1e-5)
+
+
+def test_compensated_sum_chebyshev() -> None:
+    limit: int = 1_000_000
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0] = sieve[1] = 0
+    for i in range(2, int(limit**0.5) + 1):
+        if sieve[i]:
+            sieve[i * i :: i] = bytearray(len(range(i * i, limit + 1, i)))
+    expected = math.fsum(math.log(p) for p in range(limit + 1) if sieve[p])
+    assert mega.Chebyshev(float(limit)).compute() == pytest.approx(expected, rel=1e-15)
+
+
+def test_segmented_sieve_chebyshev() -> None:
+    # past prefix table limit (2^23) value come from segmented sieve,
+    # must continue table value with log of prime in (2^23, 2^23 + 1000]
+    table_limit: int = 1 << 23
+    tail = [
+        n
+        for n in range(table_limit + 1, table_limit + 1001)
+        if all(n % d for d in range(2, math.isqrt(n) + 1))
+    ]
+    base = mega.Chebyshev(float(table_limit)).compute()
+    result = mega.Chebyshev(float(table_limit + 1000)).compute()
+    expected = base + math.fsum(math.log(p) for p in tail)
+    assert result == pytest.approx(expected, rel=1e-14)
+
+
+@pytest.mark.parametrize("x", [float("inf"), float("-inf"), float("nan")])
+def test_non_finite_chebyshev(x) -> None:
+    with pytest.raises(ValueError):
+        mega.Chebyshev(x)
+
+
+@pytest.mark.parametrize("x", [-1e6, 1.5, float("-inf"), float("nan")])
+def test_invalid_attribute_chebyshev(x) -> None:
+    # x is public attribute, compute must validate again before lookup
+    ch = mega.Chebyshev(10.0)
+    ch.x = x
+    with pytest.raises(ValueError):
+        ch.compute()
+
+
+def test_too_large_chebyshev() -> None:
+    with pytest.raises(OverflowError):
+        mega.Chebyshev(1e30)
+
+
 def test_setitem_manual_cache_chebyshev() -> None:
     res = mega.Chebyshev(10.0)
     res[10] = 5.3471
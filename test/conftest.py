@@ -0,0 +1,22 @@
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_mega() -> None:
+    """
+    import mega and touch every extension once before first test, so
+    first-call cost (shared library load, sieve table build) not
+    counted into whichever test happen to run first under --durations
+    """
+    import mega
+
+    mega.EulerPhi(2).compute()
+    mega.SigmaZ(2, 1).compute()
+    mega.Chebyshev(10.0).compute()
+    mega.Gamma(1.5).compute()
+    mega.Haversine(0.0).compute()
+    mega.JordanTotient(2, 1).compute()
+    mega.mobius(2)
+    mega.Quartic(1, 0, 0, 0, 0).compute(0.0)
+    mega.Tensor((1,), dtype="long")
+    mega.lucas_number(2)
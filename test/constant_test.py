@@ -46,9 +46,9 @@ GOLDEN_RATIO_VALUE: dict = {
 TRUE_PHI: float = (1 + (5**0.5)) / 2
 
 
-def test_scalar_input_catalan_number() -> None:
-    for i, expected in enumerate(CATALAN_VALUES):
-        assert mega.catalan_number(i) == expected
+@pytest.mark.parametrize("i,expected", list(enumerate(CATALAN_VALUES)))
+def test_scalar_input_catalan_number(i, expected) -> None:
+    assert mega.catalan_number(i) == expected
 
 
 def test_negative_index_catalan_number() -> None:
@@ -56,9 +56,9 @@ def test_negative_index_catalan_number() -> None:
         mega.catalan_number(-1)
 
 
-def test_known_values_lucas_number() -> None:
-    for n, expected in LUCAS_VALUES.items():
-        assert mega.lucas_number(n) == expected, f"lucas_number({n}) must be {expected}"
+@pytest.mark.parametrize("n,expected", LUCAS_VALUES.items())
+def test_known_values_lucas_number(n, expected) -> None:
+    assert mega.lucas_number(n) == expected, f"lucas_number({n}) must be {expected}"
 
 
 def test_zero_one_lucas_number() -> None:
@@ -72,12 +72,20 @@ def test_large_value_lucas_number() -> None:
     assert mega.lucas_number(40) == 228826127
 
 
-def test_value_golden_ratio() -> None:
-    for iterations, expected in GOLDEN_RATIO_VALUE.items():
-        result = mega.golden_ratio(iterations)
-        assert (
-            abs(result - expected) < 1e-3
-        ), f"golden_ratio({iterations}) = {result}, expected {expected}"
+def test_beyond_64bit_lucas_catalan_number() -> None:
+    assert mega.lucas_number(100) == 792070839848372253127
+    assert mega.catalan_number(40) == 2622127042276492108820
+    # smaller index after larger one served from memoized sequence
+    assert mega.lucas_number(10) == 123
+    assert mega.catalan_number(10) == 16796
+
+
+@pytest.mark.parametrize("iterations,expected", GOLDEN_RATIO_VALUE.items())
+def test_value_golden_ratio(iterations, expected) -> None:
+    result = mega.golden_ratio(iterations)
+    assert (
+        abs(result - expected) < 1e-3
+    ), f"golden_ratio({iterations}) = {result}, expected {expected}"
 
 
 def test_coverage_to_phi_golden_ratio() -> None:
@@ -85,6 +93,10 @@ def test_coverage_to_phi_golden_ratio() -> None:
     assert abs(result - TRUE_PHI) < 1e-3
 
 
+def test_large_iteration_golden_ratio() -> None:
+    assert mega.golden_ratio(1_000_000) == TRUE_PHI
+
+
 def test_return_type_golden_ratio() -> None:
     result = mega.golden_ratio()
     assert isinstance(result, float)
@@ -1,4 +1,5 @@
 import math
+import sys
 import mega
 import pytest
 
@@ -74,12 +75,22 @@ def test_haversine_with_earth_distance_formula() -> None:
     assert dist < 1e-9, f"distance should be zero, got {dist} km"
 
 
-def test_value_gamma() -> None:
-    for point, expected in GAMMA_VALUE:
-        result = mega.Gamma(point).compute()
-        assert (
-            abs(result - expected) < 1e-5
-        ), f"gamma({point}) = {result}, expected {expected}"
+def test_compute_batch_haversine() -> None:
+    import numpy as np
+
+    theta = np.linspace(-2 * math.pi, 2 * math.pi, 1001)
+    result = mega.Haversine.compute_batch(theta)
+    expected = [mega.Haversine(t).compute() for t in theta]
+    assert result.shape == theta.shape
+    assert np.allclose(result, expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("point,expected", GAMMA_VALUE)
+def test_value_gamma(point, expected) -> None:
+    result = mega.Gamma(point).compute()
+    assert (
+        abs(result - expected) < 1e-5
+    ), f"gamma({point}) = {result}, expected {expected}"
 
 
 def test_integer_input_gamma() -> None:
@@ -87,6 +98,11 @@ def test_integer_input_gamma() -> None:
     assert mega.Gamma(7).compute() == pytest.approx(720.0, rel=1e-10)
 
 
+@pytest.mark.parametrize("z", [0.1, 0.75, 1.5, 2.5, 7.3, 30.2, 170.5])
+def test_non_integer_gamma(z) -> None:
+    assert mega.Gamma(z).compute() == pytest.approx(math.gamma(z), rel=1e-12)
+
+
 def test_reflection_gamma() -> None:
     z: float = 1.0 / 3.0
     expected = math.pi / math.sin(math.pi * z)
@@ -94,22 +110,87 @@ def test_reflection_gamma() -> None:
     assert abs(result - expected) < 1e-10
 
 
-def test_value_jordan_totient() -> None:
-    for n, k, expected in JORDAN_TOTIEN_VALUE:
-        result = mega.JordanTotient(n, k).compute()
-        assert (
-            result == expected
-        ), f"JordanTotient({n}, {k}) = {result}, expected = {expected}"
+@pytest.mark.parametrize("n,k,expected", JORDAN_TOTIEN_VALUE)
+def test_value_jordan_totient(n, k, expected) -> None:
+    result = mega.JordanTotient(n, k).compute()
+    assert (
+        result == expected
+    ), f"JordanTotient({n}, {k}) = {result}, expected = {expected}"
 
 
-def test_k_zero_jordan_totient() -> None:
-    for n in range(1, 21):
-        assert mega.JordanTotient(n, 0).compute() == 0
+@pytest.mark.parametrize("n", range(1, 21))
+def test_k_zero_jordan_totient(n) -> None:
+    assert mega.JordanTotient(n, 0).compute() == 0
 
 
 def test_large_input_jordan_totient() -> None:
-    assert mega.JordanTotient(100, 2).compute() == 5184
-    assert mega.JordanTotient(12, 2).compute() == 72
+    assert mega.JordanTotient(100, 2).compute() == 7200
+    assert mega.JordanTotient(12, 2).compute() == 96
+
+
+@pytest.mark.parametrize("k", range(4))
+def test_batch_jordan_totient(k) -> None:
+    result = mega.JordanTotient.batch(60, k)
+    assert len(result) == 61
+    assert result[0] == 0
+    for n in range(1, 61):
+        assert result[n] == mega.JordanTotient(n, k).compute()
+
+
+def test_prime_power_jordan_totient() -> None:
+    # Jₖ(pᵃ) = p^((a-1)k) × (pᵏ - 1)
+    assert mega.JordanTotient(4, 1).compute() == 2
+    assert mega.JordanTotient(8, 2).compute() == 48
+    assert mega.JordanTotient(27, 3).compute() == 27**2 * 26
+    assert list(mega.JordanTotient.batch(9, 1)) == [0, 1, 1, 2, 2, 4, 2, 6, 4, 6]
+
+
+def test_numba_kernel_jordan_totient() -> None:
+    pytest.importorskip("numba")
+    from mega.op._jordan_numba import jordan_range
+
+    for k in range(1, 4):
+        result = jordan_range(200, k)
+        assert result[0] == 0
+        for n in range(1, 201):
+            assert result[n] == mega.JordanTotient(n, k).compute()
+
+
+def _jordan_exact(n: int, k: int) -> int:
+    result = n**k
+    for p in range(2, n + 1):
+        if n % p == 0 and all(p % d for d in range(2, math.isqrt(p) + 1)):
+            result = result // p**k * (p**k - 1)
+    return result
+
+
+def test_exact_above_double_jordan_totient() -> None:
+    # nᵏ > 2^53, double pow lose low digit here
+    assert mega.JordanTotient(999_983, 3).compute() == 999_949_000_866_995_086
+    assert mega.JordanTotient(999_999, 3).compute() == 958_975_600_199_460_480
+    for n in [1_553, 4_096, 5_005, 6_000]:
+        assert mega.JordanTotient(n, 5).compute() == _jordan_exact(n, 5)
+
+
+def test_batch_with_and_without_numba_jordan_totient(monkeypatch) -> None:
+    pytest.importorskip("numba")
+    # k = 5 and n up to 6000: nᵏ between 2^53 and 2^63
+    with_numba = mega.JordanTotient.batch(6_000, 5)
+    monkeypatch.setitem(sys.modules, "mega.op._jordan_numba", None)
+    without_numba = mega.JordanTotient.batch(6_000, 5)
+    assert (with_numba == without_numba).all()
+    assert with_numba[6_000] == _jordan_exact(6_000, 5)
+
+
+def test_overflow_jordan_totient(monkeypatch) -> None:
+    with pytest.raises(OverflowError):
+        mega.JordanTotient(6, 40).compute()
+    with pytest.raises(OverflowError):
+        mega.JordanTotient.batch(6, 40)
+    # same error from per value fallback when numba not importable
+    monkeypatch.setitem(sys.modules, "mega.op._jordan_numba", None)
+    with pytest.raises(OverflowError):
+        mega.JordanTotient.batch(6, 40)
 
 
 def test_function_mobius() -> None:
@@ -126,6 +207,28 @@ def test_square_factor_mobius() -> None:
     assert mega.mobius(100) == 0
 
 
+def test_range_mobius() -> None:
+    result = mega.mobius_range(30)
+    assert result.dtype.name == "int8"
+    assert len(result) == 31
+    assert result[0] == 0
+    assert list(result[1:11]) == [1, -1, -1, 0, -1, 1, -1, 0, 0, 1]
+    for n in range(1, 31):
+        assert result[n] == mega.mobius(n)
+
+
+def test_beyond_sieve_limit_mobius() -> None:
+    # 2 * 3 * 7 * 11 * 13 * 41 * 61 > sieve table limit, seven distinct prime
+    assert mega.mobius(2 * 3 * 7 * 11 * 13 * 41 * 61) == -1
+    assert mega.mobius(4 * 3_000_017) == 0
+
+
+def test_prime_near_int_max_mobius() -> None:
+    # 2^31 - 1 prime, trial division loop bound must not overflow int
+    assert mega.mobius(2_147_483_647) == -1
+    assert mega.mobius(46_337 * 46_337) == 0
+
+
 def test_compute_quartic() -> None:
     quar = mega.Quartic(1, 2, 3, 4, 5)
     assert quar.compute(0) == 5.0
@@ -138,3 +241,76 @@ def test_large_input_quartic() -> None:
     expected = x**4 + x**3 + x**2 + x + 1
     result = quar(x)
     assert result == pytest.approx(expected, abs=1e-10)
+
+
+@pytest.mark.parametrize(
+    "coeffs,expected",
+    [
+        ((1, -10, 35, -50, 24), [1, 2, 3, 4]),
+        ((1, 0, -5, 0, 4), [-2, -1, 1, 2]),
+        ((2, -2, -4, 0, 0), [-1, 0, 0, 2]),
+    ],
+)
+def test_real_roots_quartic(coeffs, expected) -> None:
+    roots = sorted(mega.Quartic(*coeffs).roots(), key=lambda z: z.real)
+    for root, value in zip(roots, expected):
+        assert root == pytest.approx(value, abs=1e-9)
+
+
+def test_complex_roots_quartic() -> None:
+    for root in mega.Quartic(1, 0, 0, 0, 1).roots():
+        assert abs(root**4 + 1) < 1e-12
+        assert abs(abs(root.real) - math.sqrt(0.5)) < 1e-12
+
+
+def test_zero_leading_coefficient_quartic() -> None:
+    with pytest.raises(ValueError):
+        mega.Quartic(0, 1, 2, 3, 4).roots()
+
+
+def test_solve_batch_quartic() -> None:
+    import numpy as np
+
+    coeffs = np.random.default_rng(7).normal(size=(200, 5))
+    result = mega.Quartic.solve_batch(coeffs)
+    assert result.shape == (200, 4)
+    for row, roots in zip(coeffs, result):
+        # every numpy root must have a matching root from solver
+        for expected in np.roots(row):
+            assert np.min(np.abs(roots - expected)) < 1e-8 * max(1.0, abs(expected))
+        assert np.allclose(roots, mega.Quartic(*row).roots())
+
+
+def test_small_leading_coefficient_quartic() -> None:
+    # ferrari break down when a tiny, must fall back to stable solver,
+    # listed root exact only up to O(a) perturbation
+    expected = [-1e8, -1, -1j, 1j]
+    coeffs = (1e-8, 1, 1, 1, 1)
+    batch = list(mega.Quartic.solve_batch([coeffs])[0])
+    for roots in (mega.Quartic(*coeffs).roots(), batch):
+        roots = sorted(roots, key=lambda z: (z.real, z.imag))
+        for got, want in zip(roots, expected):
+            assert abs(got - want) < 1e-6 * max(1.0, abs(want))
+
+
+def test_solve_batch_non_finite_quartic() -> None:
+    import numpy as np
+
+    nan, inf = float("nan"), float("inf")
+    coeffs = [
+        [1, -10, 35, -50, 24],
+        [1, 2, 3, 4, nan],
+        [inf, 1, 1, 1, 1],
+        [0, 1, 2, 3, 4],
+        [1e-8, 1, 1, 1, 1],
+    ]
+    result = mega.Quartic.solve_batch(coeffs)
+    assert result.shape == (5, 4)
+    assert np.allclose(sorted(result[0], key=lambda z: z.real), [1, 2, 3, 4])
+    assert np.isnan(result[1:4]).all()
+    assert np.allclose(result[4], mega.Quartic(*coeffs[4]).roots())
+
+
+def test_non_finite_roots_quartic() -> None:
+    with pytest.raises(ValueError):
+        mega.Quartic(1, 2, 3, 4, float("nan")).roots()
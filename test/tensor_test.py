@@ -107,6 +107,44 @@ def test_multiply_2d_tensor() -> None:
     assert result.tolist() == [[5, 12], [21, 32]]
 
 
+@pytest.mark.parametrize("dtype", ["float", "double"])
+def test_add_multiply_floating_tensor(dtype) -> None:
+    tensor1 = mega.Tensor((4,), [1.5, 2.0, 3.0, 4.0], dtype=dtype)
+    tensor2 = mega.Tensor((4,), [0.5, 1.0, 1.5, 2.0], dtype=dtype)
+
+    assert tensor1.add(tensor2).tolist() == [2.0, 3.0, 4.5, 6.0]
+    assert tensor1.multiply(tensor2).tolist() == [0.75, 2.0, 4.5, 8.0]
+
+
+def test_inplace_add_multiply_tensor() -> None:
+    tensor1 = mega.Tensor((3,), [1, 2, 3], dtype="long")
+    tensor2 = mega.Tensor((3,), [4, 5, 6], dtype="long")
+
+    result = tensor1.add_(tensor2)
+    assert result is tensor1
+    assert tensor1.tolist() == [5, 7, 9]
+
+    tensor1.multiply_(tensor2).add_(tensor2)
+    assert tensor1.tolist() == [24, 40, 60]
+    assert tensor2.tolist() == [4, 5, 6]
+
+
+def test_out_parameter_tensor() -> None:
+    tensor1 = mega.Tensor.fromlist([[1, 2], [3, 4]], dtype="int")
+    tensor2 = mega.Tensor.fromlist([[10, 20], [30, 40]], dtype="int")
+    out = mega.Tensor((2, 2), dtype="int")
+
+    assert tensor1.add(tensor2, out=out) is out
+    assert out.tolist() == [[11, 22], [33, 44]]
+    assert tensor1.multiply(tensor2, out) is out
+    assert out.tolist() == [[10, 40], [90, 160]]
+
+    with pytest.raises(ValueError):
+        tensor1.add(tensor2, out=mega.Tensor((3,), dtype="int"))
+    with pytest.raises(TypeError):
+        tensor1.add(tensor2, out=mega.Tensor((2, 2), dtype="long"))
+
+
 def test_out_of_bound_indexing_tensor() -> None:
     tensor = mega.Tensor((3,), dtype="long")
     with pytest.raises(IndexError):